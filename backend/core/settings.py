@@ -142,6 +142,8 @@ if ENABLE_PERIODIC_DISCOVERY:
 ENABLE_REAL_CONVERSION = env.bool("ENABLE_REAL_CONVERSION", default=False)
 MIGRATION_OUTPUT_DIR = env("MIGRATION_OUTPUT_DIR", default="/var/lib/vm-migrator/images")
 VIRT_V2V_TIMEOUT_SECONDS = env.int("VIRT_V2V_TIMEOUT_SECONDS", default=7200)
+# Boot disk detection for multi-disk VMs: all | sda_first | never (filename heuristics only).
+DISK_INSPECT_STRATEGY = env("DISK_INSPECT_STRATEGY", default="sda_first")
 
 ENABLE_ROLLBACK = env.bool("ENABLE_ROLLBACK", default=True)
 
@@ -149,6 +151,14 @@ ENABLE_ROLLBACK = env.bool("ENABLE_ROLLBACK", default=True)
 ENABLE_ARTIFACT_BACKUP = env.bool("ENABLE_ARTIFACT_BACKUP", default=False)
 ARTIFACT_BACKUP_DIR = env("ARTIFACT_BACKUP_DIR", default=str(Path(MIGRATION_OUTPUT_DIR) / "backups"))
 ARTIFACT_BACKUP_REQUIRED = env.bool("ARTIFACT_BACKUP_REQUIRED", default=False)
+# Back up with `qemu-img convert` (skips unallocated clusters; fast for sparse images) instead of a file copy.
+ARTIFACT_BACKUP_USE_QEMU_IMG = env.bool("ARTIFACT_BACKUP_USE_QEMU_IMG", default=False)
+# Hardlink backups when on the same filesystem as the output (no copy; the inode is shared).
+# A hardlink is not an independent backup: anything rewriting the output in place (eg. a
+# reconversion of the same job) rewrites the "backup" too, and it still looks current.
+ARTIFACT_BACKUP_ALLOW_HARDLINK = env.bool("ARTIFACT_BACKUP_ALLOW_HARDLINK", default=False)
+# Disks of one multi-disk VM backed up concurrently.
+ARTIFACT_BACKUP_PARALLELISM = env.int("ARTIFACT_BACKUP_PARALLELISM", default=4)
 
 # ESXi conversion guardrails
 VMWARE_REQUIRE_NO_SNAPSHOTS = env.bool("VMWARE_REQUIRE_NO_SNAPSHOTS", default=True)
@@ -166,6 +176,11 @@ OPENSTACK_IMAGE_UPLOAD_TIMEOUT = env.int("OPENSTACK_IMAGE_UPLOAD_TIMEOUT", defau
 OPENSTACK_IMAGE_UPLOAD_POLL_INTERVAL = env.int("OPENSTACK_IMAGE_UPLOAD_POLL_INTERVAL", default=5)
 OPENSTACK_API_RETRIES = env.int("OPENSTACK_API_RETRIES", default=2)
 OPENSTACK_API_RETRY_DELAY = env.int("OPENSTACK_API_RETRY_DELAY", default=3)
+# Disks uploaded to Glance and turned into Cinder volumes concurrently per migration.
+OPENSTACK_PARALLEL_UPLOADS = env.int("OPENSTACK_PARALLEL_UPLOADS", default=4)
+# How long flavor/network listings (request validation) are reused per endpoint session;
+# deployment flavor/network picks use this too, capped at 30 seconds.
+OPENSTACK_LISTING_CACHE_SECONDS = env.int("OPENSTACK_LISTING_CACHE_SECONDS", default=60)
 
 # Ansible conversion controls
 ENABLE_ANSIBLE_CONVERSION = env.bool("ENABLE_ANSIBLE_CONVERSION", default=False)
@@ -3,17 +3,31 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
+import tempfile
 import time
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_TRUNCATED_MARKER = "...[earlier output truncated]\n"
+
 
 class AnsibleRunnerError(Exception):
     """Raised when ansible-playbook execution fails."""
 
 
+def _read_tail(spool, max_chars: int) -> str:
+    """Decode the end of a spooled stream; the result, marker included, fits in ``max_chars``."""
+    size = spool.seek(0, 2)
+    if size <= max_chars:
+        spool.seek(0)
+        return spool.read().decode("utf-8", "replace")
+    keep = max(0, max_chars - len(_TRUNCATED_MARKER))
+    spool.seek(size - keep)
+    return _TRUNCATED_MARKER + spool.read().decode("utf-8", "replace")
+
+
 class AnsibleRunner:
     def __init__(self, *, binary: str = "ansible-playbook") -> None:
         self.binary = binary
@@ -26,7 +40,9 @@ class AnsibleRunner:
         extra_vars: dict[str, Any] | None = None,
         limit: str | None = None,
         timeout_seconds: int = 7200,
+        max_log_chars: int = 12000,
     ) -> dict[str, Any]:
+        """Run one playbook; stdout/stderr keep at most the last ``max_log_chars`` characters each."""
         playbook = Path(playbook_path).expanduser().resolve()
         inventory = Path(inventory_path).expanduser().resolve()
 
@@ -51,22 +67,27 @@ class AnsibleRunner:
         )
 
         started = time.monotonic()
-        try:
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=timeout_seconds,
-            )
-        except FileNotFoundError as exc:
-            raise AnsibleRunnerError("ansible-playbook binary not found") from exc
-        except subprocess.TimeoutExpired as exc:
-            raise AnsibleRunnerError(
-                f"ansible-playbook timed out after {timeout_seconds}s"
-            ) from exc
-        except OSError as exc:
-            raise AnsibleRunnerError(f"ansible-playbook failed to start: {exc}") from exc
+        # Spool output to disk rather than memory: playbooks wrapping virt-v2v can print
+        # megabytes, and only the tail is ever kept.
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            try:
+                completed = subprocess.run(
+                    cmd,
+                    stdout=out,
+                    stderr=err,
+                    check=False,
+                    timeout=timeout_seconds,
+                )
+            except FileNotFoundError as exc:
+                raise AnsibleRunnerError("ansible-playbook binary not found") from exc
+            except subprocess.TimeoutExpired as exc:
+                raise AnsibleRunnerError(
+                    f"ansible-playbook timed out after {timeout_seconds}s"
+                ) from exc
+            except OSError as exc:
+                raise AnsibleRunnerError(f"ansible-playbook failed to start: {exc}") from exc
+            stdout = _read_tail(out, max_log_chars)
+            stderr = _read_tail(err, max_log_chars)
 
         duration = round(time.monotonic() - started, 3)
         status = "success" if completed.returncode == 0 else "failed"
@@ -75,8 +96,8 @@ class AnsibleRunner:
             "status": status,
             "returncode": completed.returncode,
             "duration_seconds": duration,
-            "stdout": completed.stdout or "",
-            "stderr": completed.stderr or "",
+            "stdout": stdout,
+            "stderr": stderr,
             "command": cmd,
         }
 
@@ -1,11 +1,49 @@
+import json
+
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import NotSupportedError, connections, models, router
+from django.db.models import F, Func
+from django.utils import timezone
 
 
 class InvalidTransitionError(ValidationError):
     """Raised when a state transition is not allowed."""
 
 
+class JSONSetKey(Func):
+    """Replace one top-level key of a JSON column in SQL, leaving the rest of the stored document as is."""
+
+    VENDORS = frozenset({"postgresql", "sqlite", "mysql"})
+    output_field = models.JSONField()
+
+    def __init__(self, field_name: str, key: str, value):
+        self.key = key
+        self.value_json = json.dumps(value)
+        super().__init__(F(field_name))
+
+    def _column(self, compiler):
+        return compiler.compile(self.get_source_expressions()[0])
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONSetKey is not supported on '{connection.vendor}'.")
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        column, params = self._column(compiler)
+        sql = f"jsonb_set(COALESCE({column}, '{{}}'::jsonb), %s::text[], %s::jsonb)"
+        return sql, (*params, [self.key], self.value_json)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        column, params = self._column(compiler)
+        sql = f"json_set(COALESCE({column}, '{{}}'), %s, json(%s))"
+        return sql, (*params, f'$."{self.key}"', self.value_json)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        column, params = self._column(compiler)
+        # JSON_EXTRACT(.., '$') parses the value on both MySQL and MariaDB (no JSON type cast there).
+        sql = f"JSON_SET(COALESCE({column}, JSON_OBJECT()), %s, JSON_EXTRACT(%s, '$'))"
+        return sql, (*params, f'$."{self.key}"', self.value_json)
+
+
 class MigrationJob(models.Model):
     class Status(models.TextChoices):
         PENDING = "PENDING", "Pending"
@@ -50,7 +88,8 @@ class MigrationJob(models.Model):
             return False
         return new_status in self.TRANSITIONS.get(self.status, set())
 
-    def transition(self, new_status: str) -> None:
+    def transition(self, new_status: str, *, save: bool = True) -> None:
+        """Validate and apply a status change; ``save=False`` leaves persisting to the caller."""
         if new_status not in self.Status.values:
             raise InvalidTransitionError(
                 f"Unknown target status '{new_status}'. Allowed values: {', '.join(self.Status.values)}"
@@ -64,7 +103,25 @@ class MigrationJob(models.Model):
             )
 
         self.status = new_status
-        self.save(update_fields=["status", "updated_at"])
+        if save:
+            self.save(update_fields=["status", "updated_at"])
+
+    def save_metadata_section(self, key: str, *, update_fields: tuple[str, ...] = ()) -> None:
+        """Persist ``conversion_metadata[key]`` (plus ``update_fields``) without resending the whole document.
+
+        Only valid when no other metadata key has unsaved changes. Falls back to a full save on
+        database vendors without JSON set support.
+        """
+        db = self._state.db or router.db_for_write(type(self), instance=self)
+        if connections[db].vendor not in JSONSetKey.VENDORS:
+            self.save(using=db, update_fields=["conversion_metadata", "updated_at", *update_fields])
+            return
+
+        self.updated_at = timezone.now()
+        values = {name: getattr(self, name) for name in update_fields}
+        values["updated_at"] = self.updated_at
+        values["conversion_metadata"] = JSONSetKey("conversion_metadata", key, self.conversion_metadata.get(key))
+        type(self).objects.using(db).filter(pk=self.pk).update(**values)
 
 
 class DiscoveredVM(models.Model):
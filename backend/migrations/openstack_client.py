@@ -7,58 +7,15 @@ from collections import defaultdict
 from ipaddress import ip_address, ip_network
 from typing import Any
 
-import openstack
 from keystoneauth1 import exceptions as ks_exceptions
 from openstack import exceptions as os_exceptions
-from openstack.config import OpenStackConfig
-from openstack.connection import Connection
 
 from .openstack_deployment import OpenStackDeploymentError, connect_openstack
 
+
 class OpenStackClientError(Exception):
     """Raised when OpenStack connectivity or API reads fail."""
 
-def _bool_from_env(value: str | None) -> bool | None:
-    if value is None:
-        return None
-    v = value.strip().lower()
-    if v in {"1", "true", "yes", "y", "on"}:
-        return True
-    if v in {"0", "false", "no", "n", "off"}:
-        return False
-    return None
-
-
-def _connect_kwargs_from_env() -> dict[str, Any] | None:
-    """Build auth kwargs from OS_* env vars (preferred for DevStack setups)."""
-    auth_url = os.environ.get("OS_AUTH_URL", "").strip() or None
-    if not auth_url:
-        return None
-
-    # Keep required fields explicit so we don't accidentally pick up stale root-owned clouds.yaml.
-    kwargs: dict[str, Any] = {
-        "auth_url": auth_url,
-        "username": os.environ.get("OS_USERNAME", "").strip() or None,
-        "password": os.environ.get("OS_PASSWORD", "").strip() or None,
-        "project_name": os.environ.get("OS_PROJECT_NAME", "").strip() or None,
-        "user_domain_name": os.environ.get("OS_USER_DOMAIN_NAME", "").strip() or "Default",
-        "project_domain_name": os.environ.get("OS_PROJECT_DOMAIN_NAME", "").strip() or "Default",
-        "region_name": os.environ.get("OS_REGION_NAME", "").strip() or None,
-        "interface": os.environ.get("OS_INTERFACE", "").strip() or None,
-        "identity_api_version": os.environ.get("OS_IDENTITY_API_VERSION", "").strip() or None,
-    }
-
-    verify = _bool_from_env(os.environ.get("OS_VERIFY"))
-    if verify is not None:
-        kwargs["verify"] = verify
-
-    # Optional: bypass proxy endpoints for Glance.
-    image_endpoint_override = os.environ.get("OPENSTACK_IMAGE_ENDPOINT_OVERRIDE", "").strip() or None
-    if image_endpoint_override:
-        kwargs["image_endpoint_override"] = image_endpoint_override
-
-    return kwargs
-
 
 class OpenStackClient:
     """Small abstraction around openstacksdk using cloud='openstack'."""
@@ -153,6 +110,32 @@ class OpenStackClient:
         except Exception as exc:
             raise OpenStackClientError(f"Unexpected error while listing OpenStack networks: {exc}") from exc
 
+    def list_flavor_ids(self) -> set[str]:
+        """Return flavor ids only (uses the non-detailed flavor listing)."""
+        try:
+            return {flavor.id for flavor in self._conn.compute.flavors(details=False) if flavor.id}
+        except (os_exceptions.SDKException, ks_exceptions.ClientException) as exc:
+            raise OpenStackClientError(f"Failed to list OpenStack flavors: {exc}") from exc
+        except Exception as exc:
+            raise OpenStackClientError(f"Unexpected error while listing OpenStack flavors: {exc}") from exc
+
+    def list_network_index(self) -> tuple[set[str], dict[str, list[str]]]:
+        """Return (network ids, network ids by name), asking Neutron for id/name fields only."""
+        try:
+            network_ids: set[str] = set()
+            ids_by_name: dict[str, list[str]] = defaultdict(list)
+            for network in self._conn.network.networks(fields=["id", "name"]):
+                if not network.id:
+                    continue
+                network_ids.add(network.id)
+                if network.name:
+                    ids_by_name[network.name].append(network.id)
+            return network_ids, dict(ids_by_name)
+        except (os_exceptions.SDKException, ks_exceptions.ClientException) as exc:
+            raise OpenStackClientError(f"Failed to list OpenStack networks: {exc}") from exc
+        except Exception as exc:
+            raise OpenStackClientError(f"Unexpected error while listing OpenStack networks: {exc}") from exc
+
     def list_networks_detail(self) -> list[dict[str, Any]]:
         """List available tenant/provider networks with subnet pools and available IPs."""
         try:
@@ -205,77 +188,96 @@ class OpenStackClient:
 
     def validate_fixed_ip(self, *, network_id: str, fixed_ip: str) -> tuple[bool, str | None]:
         """Validate fixed IP against allocation pools and existing ports."""
-        try:
-            network = self._conn.network.find_network(network_id, ignore_missing=True)
-            if network is None:
-                return False, f"Network '{network_id}' not found."
-
-            try:
-                fixed_ip_value = ip_address(str(fixed_ip))
-            except ValueError:
-                return False, "Invalid IP address format."
-
-            subnets = [
-                subnet
-                for subnet in self._conn.network.subnets()
-                if getattr(subnet, "network_id", None) == network_id
-            ]
-            if not subnets:
-                return False, "Network has no subnets."
+        return self.validate_fixed_ips([(network_id, fixed_ip)])[0]
 
-            in_pool = False
-            for subnet in subnets:
-                gateway_ip = getattr(subnet, "gateway_ip", None)
-                if gateway_ip and str(fixed_ip_value) == str(gateway_ip):
-                    return False, "IP matches subnet gateway."
-
-                allocation_pools = getattr(subnet, "allocation_pools", None) or []
-                if allocation_pools:
-                    for pool in allocation_pools:
-                        if not isinstance(pool, dict):
-                            continue
-                        start = pool.get("start")
-                        end = pool.get("end")
-                        if not start or not end:
-                            continue
-                        try:
-                            start_ip = ip_address(str(start))
-                            end_ip = ip_address(str(end))
-                        except ValueError:
-                            continue
-                        if start_ip <= fixed_ip_value <= end_ip:
-                            in_pool = True
-                            break
-                else:
-                    cidr = getattr(subnet, "cidr", None)
-                    if cidr:
-                        try:
-                            if fixed_ip_value in ip_network(str(cidr), strict=False):
-                                in_pool = True
-                        except ValueError:
-                            pass
-
-                if in_pool:
-                    break
+    def validate_fixed_ips(self, checks: list[tuple[str, str]]) -> list[tuple[bool, str | None]]:
+        """Validate several (network_id, fixed_ip) pairs, in input order.
 
-            if not in_pool:
-                return False, "IP is not inside any allocation pool."
+        Network, subnets and ports are fetched once per distinct network, so many
+        VMs sharing a network cost the same round trips as one.
+        """
+        try:
+            by_network: dict[str, list[int]] = defaultdict(list)
+            for index, (network_id, _) in enumerate(checks):
+                by_network[network_id].append(index)
+
+            results: list[tuple[bool, str | None]] = [(False, None)] * len(checks)
+            for network_id, indexes in by_network.items():
+                network = self._conn.network.find_network(network_id, ignore_missing=True)
+                if network is None:
+                    for index in indexes:
+                        results[index] = (False, f"Network '{network_id}' not found.")
+                    continue
 
-            for port in self._conn.network.ports(network_id=network_id):
-                fixed_ips = getattr(port, "fixed_ips", None) or []
-                for fixed in fixed_ips:
-                    if not isinstance(fixed, dict):
-                        continue
-                    if str(fixed.get("ip_address")) == str(fixed_ip_value):
-                        return False, "IP is already in use."
+                subnets = list(self._conn.network.subnets(network_id=network_id))
+                used_ips = set()
+                for port in self._conn.network.ports(network_id=network_id):
+                    for fixed in getattr(port, "fixed_ips", None) or []:
+                        if isinstance(fixed, dict) and fixed.get("ip_address"):
+                            used_ips.add(str(fixed["ip_address"]))
 
-            return True, None
+                for index in indexes:
+                    results[index] = _check_fixed_ip(str(checks[index][1]), subnets, used_ips)
+            return results
         except (os_exceptions.SDKException, ks_exceptions.ClientException) as exc:
             raise OpenStackClientError(f"Failed to validate fixed IP: {exc}") from exc
         except Exception as exc:
             raise OpenStackClientError(f"Unexpected error while validating fixed IP: {exc}") from exc
 
 
+def _check_fixed_ip(fixed_ip: str, subnets: list[Any], used_ips: set[str]) -> tuple[bool, str | None]:
+    try:
+        fixed_ip_value = ip_address(fixed_ip)
+    except ValueError:
+        return False, "Invalid IP address format."
+
+    if not subnets:
+        return False, "Network has no subnets."
+
+    in_pool = False
+    for subnet in subnets:
+        gateway_ip = getattr(subnet, "gateway_ip", None)
+        if gateway_ip and str(fixed_ip_value) == str(gateway_ip):
+            return False, "IP matches subnet gateway."
+
+        allocation_pools = getattr(subnet, "allocation_pools", None) or []
+        if allocation_pools:
+            for pool in allocation_pools:
+                if not isinstance(pool, dict):
+                    continue
+                start = pool.get("start")
+                end = pool.get("end")
+                if not start or not end:
+                    continue
+                try:
+                    start_ip = ip_address(str(start))
+                    end_ip = ip_address(str(end))
+                except ValueError:
+                    continue
+                if start_ip <= fixed_ip_value <= end_ip:
+                    in_pool = True
+                    break
+        else:
+            cidr = getattr(subnet, "cidr", None)
+            if cidr:
+                try:
+                    if fixed_ip_value in ip_network(str(cidr), strict=False):
+                        in_pool = True
+                except ValueError:
+                    pass
+
+        if in_pool:
+            break
+
+    if not in_pool:
+        return False, "IP is not inside any allocation pool."
+
+    if str(fixed_ip_value) in used_ips:
+        return False, "IP is already in use."
+
+    return True, None
+
+
 def _format_subnet_details(subnet: Any, used_ips: set[int], limit: int) -> dict[str, Any]:
     cidr = getattr(subnet, "cidr", None)
     gateway_ip = getattr(subnet, "gateway_ip", None)
@@ -4,19 +4,27 @@ from __future__ import annotations
 
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from math import ceil
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import openstack
 from keystoneauth1 import exceptions as ks_exceptions
+from keystoneauth1.session import TCPKeepAliveAdapter
 from openstack import exceptions as os_exceptions
 from openstack.config import OpenStackConfig
 from openstack.connection import Connection
 
 
+_GB = 1 << 30
+# Sized above the cleanup/upload fan-out so parallel calls reuse keep-alive connections.
+_HTTP_POOL_SIZE = 32
+
+
 class OpenStackDeploymentError(Exception):
     """Raised when OpenStack deployment steps fail."""
 
@@ -29,17 +37,41 @@ class FlavorChoice:
     ram: int
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_name(value: str) -> str:
     clean = re.sub(r"[^A-Za-z0-9._-]", "-", value).strip("-._")
     return clean or "vm"
 
 
+_TRANSIENT_ERRORS = (
+    ks_exceptions.RetriableConnectionFailure,
+    ConnectionError,
+    TimeoutError,
+)
+_RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    # Only connection failures, timeouts, throttling and 5xx are worth retrying;
+    # 4xx answers, auth/catalog errors and SDK usage errors will not change.
+    if isinstance(exc, os_exceptions.HttpException):
+        return exc.status_code is not None and int(exc.status_code) in _RETRYABLE_HTTP_STATUSES
+    if isinstance(exc, ks_exceptions.HttpError):
+        return exc.http_status in _RETRYABLE_HTTP_STATUSES
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
+
 def _retry_call(operation_name: str, attempts: int, delay_seconds: int, fn: Callable[[], Any]):
     last_exc: Exception | None = None
     for idx in range(max(1, attempts)):
         try:
             return fn()
+        except OpenStackDeploymentError:
+            raise
         except Exception as exc:  # noqa: BLE001
+            # Callers (and the deploy worker threads) only ever see OpenStackDeploymentError.
+            if not _is_transient(exc):
+                raise OpenStackDeploymentError(f"{operation_name} failed: {exc}") from exc
             last_exc = exc
             if idx >= attempts - 1:
                 break
@@ -47,6 +79,56 @@ def _retry_call(operation_name: str, attempts: int, delay_seconds: int, fn: Call
     raise OpenStackDeploymentError(f"{operation_name} failed after {attempts} attempts: {last_exc}") from last_exc
 
 
+def _wait_for_status(
+    waiter: Callable[..., Any],
+    resource: Any,
+    *,
+    fetch: Callable[[str], Any],
+    what: str,
+    status: str,
+    failures: list[str],
+    timeout_seconds: int,
+    poll_interval_seconds: int,
+    cancel_event: threading.Event | None = None,
+):
+    """Wait for `resource` to reach `status`.
+
+    Without a `cancel_event` this delegates to the SDK waiter (`wait_for_status` /
+    `wait_for_server`). The SDK sleeps a full interval between polls, so with an
+    event the loop re-fetches through `fetch` and waits on the event instead,
+    failing as soon as it is set.
+    """
+    interval = max(1, poll_interval_seconds)
+    if cancel_event is None:
+        try:
+            return waiter(resource, status=status, failures=failures, interval=interval, wait=timeout_seconds)
+        except os_exceptions.ResourceFailure as exc:
+            raise OpenStackDeploymentError(f"{what[:1].upper()}{what[1:]} entered a terminal status: {exc}") from exc
+        except os_exceptions.ResourceTimeout as exc:
+            raise OpenStackDeploymentError(f"Timed out waiting for {what} to reach status '{status}'.") from exc
+
+    wanted = status.lower()
+    terminal = {failure.lower() for failure in failures}
+    deadline = time.monotonic() + timeout_seconds
+    current = resource
+    while True:
+        if cancel_event.is_set():
+            raise OpenStackDeploymentError(f"Waiting for {what} canceled")
+        current_status = str(getattr(current, "status", "")).lower()
+        if current_status == wanted:
+            return current
+        if current_status in terminal:
+            raise OpenStackDeploymentError(
+                f"{what[:1].upper()}{what[1:]} entered a terminal status: '{current_status}'."
+            )
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise OpenStackDeploymentError(f"Timed out waiting for {what} to reach status '{status}'.")
+        if cancel_event.wait(min(interval, remaining)):
+            raise OpenStackDeploymentError(f"Waiting for {what} canceled")
+        current = fetch(current.id)
+
+
 def _bool_from_env(value: str | None) -> bool | None:
     if value is None:
         return None
@@ -58,8 +140,14 @@ def _bool_from_env(value: str | None) -> bool | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def _connect_kwargs_from_env() -> dict[str, Any] | None:
-    """Build auth kwargs from OS_* env vars (preferred for DevStack setups)."""
+    """Build auth kwargs from OS_* env vars (preferred for DevStack setups).
+
+    The environment does not change during a worker's lifetime, so the result is
+    computed once. Treat it as read-only; call `_connect_kwargs_from_env.cache_clear()`
+    after rewriting OS_* variables (eg. in tests).
+    """
     auth_url = os.environ.get("OS_AUTH_URL", "").strip() or None
     if not auth_url:
         return None
@@ -87,8 +175,36 @@ def _connect_kwargs_from_env() -> dict[str, Any] | None:
     return kwargs
 
 
+def _tune_http_pool(conn) -> None:
+    """Enlarge the keep-alive pool keystoneauth mounted on the SDK session.
+
+    The replacement is the same TCPKeepAliveAdapter (keepalive, TCP_NODELAY and the
+    configured TLS options are kept). Retries stay with `_retry_call`; adapter-level
+    retries would multiply its attempts and re-stream image uploads.
+    """
+    http_session = getattr(getattr(conn, "session", None), "session", None)
+    if http_session is None:
+        return
+    for prefix in ("http://", "https://"):
+        current = http_session.adapters.get(prefix)
+        if not isinstance(current, TCPKeepAliveAdapter):
+            continue  # Leave adapters we did not expect untouched.
+        tls_kwargs = {
+            name: getattr(current, name)
+            for name in ("tls_ciphers", "tls_min_version")
+            if getattr(current, name, None)
+        }
+        http_session.mount(
+            prefix,
+            TCPKeepAliveAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE, **tls_kwargs),
+        )
+        current.close()
+
+
 def connect_openstack(cloud: str = "openstack", auth_overrides: dict[str, Any] | None = None):
     try:
+        env_kwargs = _connect_kwargs_from_env()
+        image_endpoint_override = os.environ.get("OPENSTACK_IMAGE_ENDPOINT_OVERRIDE", "").strip() or None
         if isinstance(auth_overrides, dict) and auth_overrides:
             conn = openstack.connect(
                 cloud=None,
@@ -98,11 +214,7 @@ def connect_openstack(cloud: str = "openstack", auth_overrides: dict[str, Any] |
                 app_version="1",
                 **auth_overrides,
             )
-            conn.authorize()
-            return conn
-
-        env_kwargs = _connect_kwargs_from_env()
-        if env_kwargs:
+        elif env_kwargs:
             conn = openstack.connect(
                 cloud=None,
                 load_yaml_config=False,
@@ -111,11 +223,7 @@ def connect_openstack(cloud: str = "openstack", auth_overrides: dict[str, Any] |
                 app_version="1",
                 **env_kwargs,
             )
-            conn.authorize()
-            return conn
-
-        image_endpoint_override = os.environ.get("OPENSTACK_IMAGE_ENDPOINT_OVERRIDE", "").strip() or None
-        if image_endpoint_override:
+        elif image_endpoint_override:
             # DevStack often publishes a public Glance endpoint as http://HOST/image (apache proxy),
             # which can reject PUT /v2/images/<id>/file with HTTP 415. Override to talk to Glance directly.
             cfg = OpenStackConfig(load_yaml_config=True, load_envvars=True)
@@ -124,6 +232,7 @@ def connect_openstack(cloud: str = "openstack", auth_overrides: dict[str, Any] |
             conn = Connection(config=region)
         else:
             conn = openstack.connect(cloud=cloud)
+        _tune_http_pool(conn)
         conn.authorize()
         return conn
     except (os_exceptions.ConfigException, os_exceptions.SDKException, ks_exceptions.ClientException) as exc:
@@ -132,6 +241,68 @@ def connect_openstack(cloud: str = "openstack", auth_overrides: dict[str, Any] |
         raise OpenStackDeploymentError(f"Unexpected OpenStack connection error: {exc}") from exc
 
 
+_CONNECTION_CACHE_MAX = 16
+# (cloud, frozen auth overrides) -> Connection, least recently used first.
+_CONNECTION_CACHE: dict[tuple[str, tuple[tuple[str, Any], ...]], Any] = {}
+_CONNECTION_CACHE_LOCK = threading.Lock()
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except Exception:  # noqa: BLE001 - best effort; the connection is being discarded.
+        pass
+
+
+def _cached_connection(cloud: str, frozen_overrides: tuple[tuple[str, Any], ...]):
+    key = (cloud, frozen_overrides)
+    with _CONNECTION_CACHE_LOCK:
+        conn = _CONNECTION_CACHE.pop(key, None)
+        if conn is not None:
+            _CONNECTION_CACHE[key] = conn  # Re-insert as most recently used.
+            return conn
+
+    # Authenticate outside the lock; other credentials must not wait on this login.
+    conn = connect_openstack(cloud=cloud, auth_overrides=dict(frozen_overrides) or None)
+    discarded = []
+    with _CONNECTION_CACHE_LOCK:
+        existing = _CONNECTION_CACHE.pop(key, None)
+        if existing is not None:
+            # Another thread connected first; keep its connection.
+            discarded.append(conn)
+            conn = existing
+        _CONNECTION_CACHE[key] = conn
+        while len(_CONNECTION_CACHE) > _CONNECTION_CACHE_MAX:
+            discarded.append(_CONNECTION_CACHE.pop(next(iter(_CONNECTION_CACHE))))
+    # Evicted connections release their sessions and sockets; requests still in flight on
+    # them finish, and their pools would simply be rebuilt if they were used again.
+    for old in discarded:
+        _close_quietly(old)
+    return conn
+
+
+def _clear_connection_cache() -> None:
+    """Close and forget every cached connection (eg. in tests or after credential changes)."""
+    with _CONNECTION_CACHE_LOCK:
+        discarded = list(_CONNECTION_CACHE.values())
+        _CONNECTION_CACHE.clear()
+    for conn in discarded:
+        _close_quietly(conn)
+
+
+def get_openstack_connection(cloud: str = "openstack", auth_overrides: dict[str, Any] | None = None):
+    """Like connect_openstack, but reuses one authenticated connection per cloud/credentials in this process.
+
+    keystoneauth refreshes the token on expiry, so tasks skip the Keystone login and catalog fetch.
+    The connection is shared by the deployment thread pools (disk uploads, attachment checks,
+    cleanup). That is safe: the keystoneauth session and its urllib3 pool are thread-safe (the
+    SDK fans out on one Connection itself), and service proxies created concurrently on first
+    use only cost a duplicate endpoint lookup.
+    """
+    frozen = tuple(sorted((auth_overrides or {}).items()))
+    return _cached_connection(cloud, frozen)
+
+
 def map_vmware_to_flavor(conn, cpu: int | None, ram_mb: int | None) -> FlavorChoice:
     if not cpu or not ram_mb:
         raise OpenStackDeploymentError(
@@ -211,9 +382,10 @@ def ensure_uploaded_image(
     poll_interval_seconds: int = 5,
     retries: int = 2,
     retry_delay_seconds: int = 3,
+    cancel_event: threading.Event | None = None,
 ) -> str:
     path = Path(qcow2_path).expanduser()
-    if not path.exists() or not path.is_file():
+    if not path.is_file():
         raise OpenStackDeploymentError(f"Disk artifact not found for upload: {path}")
     if disk_format not in {"qcow2", "raw"}:
         raise OpenStackDeploymentError(f"Unsupported Glance disk format '{disk_format}'. Use qcow2 or raw.")
@@ -230,6 +402,8 @@ def ensure_uploaded_image(
     # NOTE: `conn.image.upload_image(...)` is deprecated in openstacksdk and does not
     # accept a `filename=` argument (it expects `data=`). Using it will create a queued
     # image with a 0-byte backing file. Use `create_image(filename=...)` instead.
+    # With `filename=` the SDK streams the open file (Content-Length from fstat), and
+    # validate_checksum=False keeps it from hashing multi-GB disks before the PUT.
     image = _retry_call(
         "image upload",
         retries,
@@ -246,58 +420,97 @@ def ensure_uploaded_image(
         ),
     )
 
-    deadline = time.monotonic() + timeout_seconds
-    while time.monotonic() < deadline:
-        current = conn.image.get_image(image.id)
-        status = str(getattr(current, "status", "")).lower()
-        if status == "active":
-            return current.id
-        if status in {"killed", "deleted", "error"}:
-            raise OpenStackDeploymentError(
-                f"Uploaded image '{image_name}' entered terminal status '{status}'."
-            )
-        time.sleep(max(1, poll_interval_seconds))
-
-    raise OpenStackDeploymentError(f"Timed out waiting for image '{image_name}' to become active.")
+    active = _wait_for_status(
+        conn.image.wait_for_status,
+        image,
+        fetch=conn.image.get_image,
+        what=f"image '{image_name}'",
+        status="active",
+        failures=["killed", "deleted", "error"],
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        cancel_event=cancel_event,
+    )
+    return active.id
 
 
-def ensure_server_booted(
+def _boot_server(
     conn,
     *,
+    operation_name: str,
     server_name: str,
-    image_id: str,
     flavor_id: str,
     network_id: str,
+    image_id: str | None = None,
+    boot_volume_id: str | None = None,
     fixed_ip: str | None = None,
     existing_server_id: str | None = None,
     retries: int = 2,
     retry_delay_seconds: int = 3,
-) -> str:
+):
+    """Return the existing server for this job, or create it (from image or boot volume)."""
     if existing_server_id:
         existing = conn.compute.find_server(existing_server_id, ignore_missing=True)
         if existing is not None:
-            return existing.id
+            return existing
 
     existing_by_name = conn.compute.find_server(server_name, ignore_missing=True)
     if existing_by_name is not None:
-        return existing_by_name.id
+        return existing_by_name
 
     network_payload = {"uuid": network_id}
     if fixed_ip:
         network_payload["fixed_ip"] = fixed_ip
 
-    server = _retry_call(
-        "server boot",
+    create_kwargs: dict[str, Any] = {
+        "name": server_name,
+        "image_id": image_id,
+        "flavor_id": flavor_id,
+        "networks": [network_payload],
+    }
+    if boot_volume_id:
+        create_kwargs["block_device_mapping_v2"] = [
+            {
+                "uuid": boot_volume_id,
+                "source_type": "volume",
+                "destination_type": "volume",
+                "boot_index": 0,
+                "delete_on_termination": False,
+            }
+        ]
+
+    return _retry_call(
+        operation_name,
         retries,
         retry_delay_seconds,
-        lambda: conn.compute.create_server(
-            name=server_name,
-            image_id=image_id,
-            flavor_id=flavor_id,
-            networks=[network_payload],
-        ),
+        lambda: conn.compute.create_server(**create_kwargs),
     )
 
+
+def ensure_server_booted(
+    conn,
+    *,
+    server_name: str,
+    image_id: str,
+    flavor_id: str,
+    network_id: str,
+    fixed_ip: str | None = None,
+    existing_server_id: str | None = None,
+    retries: int = 2,
+    retry_delay_seconds: int = 3,
+) -> str:
+    server = _boot_server(
+        conn,
+        operation_name="server boot",
+        server_name=server_name,
+        image_id=image_id,
+        flavor_id=flavor_id,
+        network_id=network_id,
+        fixed_ip=fixed_ip,
+        existing_server_id=existing_server_id,
+        retries=retries,
+        retry_delay_seconds=retry_delay_seconds,
+    )
     return server.id
 
 
@@ -313,42 +526,70 @@ def ensure_server_booted_from_volume(
     retries: int = 2,
     retry_delay_seconds: int = 3,
 ) -> str:
-    if existing_server_id:
-        existing = conn.compute.find_server(existing_server_id, ignore_missing=True)
-        if existing is not None:
-            return existing.id
-
-    existing_by_name = conn.compute.find_server(server_name, ignore_missing=True)
-    if existing_by_name is not None:
-        return existing_by_name.id
-
-    network_payload = {"uuid": network_id}
-    if fixed_ip:
-        network_payload["fixed_ip"] = fixed_ip
+    server = _boot_server(
+        conn,
+        operation_name="server boot from volume",
+        server_name=server_name,
+        boot_volume_id=boot_volume_id,
+        flavor_id=flavor_id,
+        network_id=network_id,
+        fixed_ip=fixed_ip,
+        existing_server_id=existing_server_id,
+        retries=retries,
+        retry_delay_seconds=retry_delay_seconds,
+    )
+    return server.id
 
-    block_device_mapping_v2 = [
-        {
-            "uuid": boot_volume_id,
-            "source_type": "volume",
-            "destination_type": "volume",
-            "boot_index": 0,
-            "delete_on_termination": False,
-        }
-    ]
 
-    server = _retry_call(
-        "server boot from volume",
-        retries,
-        retry_delay_seconds,
-        lambda: conn.compute.create_server(
-            name=server_name,
-            image_id=None,
-            flavor_id=flavor_id,
-            networks=[network_payload],
-            block_device_mapping_v2=block_device_mapping_v2,
-        ),
+def boot_and_wait_active(
+    conn,
+    *,
+    server_name: str,
+    flavor_id: str,
+    network_id: str,
+    image_id: str | None = None,
+    boot_volume_id: str | None = None,
+    fixed_ip: str | None = None,
+    existing_server_id: str | None = None,
+    timeout_seconds: int = 900,
+    poll_interval_seconds: int = 10,
+    retries: int = 2,
+    retry_delay_seconds: int = 3,
+    cancel_event: threading.Event | None = None,
+) -> str:
+    """Boot (or reuse) the server and wait for ACTIVE using the SDK's waiter.
+
+    The server resource returned by create/find is handed straight to
+    `wait_for_server`, so no separate GET is spent before the first poll.
+    """
+    if not image_id and not boot_volume_id:
+        raise OpenStackDeploymentError(f"Server '{server_name}' needs an image_id or a boot_volume_id.")
+
+    server = _boot_server(
+        conn,
+        operation_name="server boot from volume" if boot_volume_id else "server boot",
+        server_name=server_name,
+        image_id=None if boot_volume_id else image_id,
+        boot_volume_id=boot_volume_id,
+        flavor_id=flavor_id,
+        network_id=network_id,
+        fixed_ip=fixed_ip,
+        existing_server_id=existing_server_id,
+        retries=retries,
+        retry_delay_seconds=retry_delay_seconds,
     )
 
+    _wait_for_status(
+        conn.compute.wait_for_server,
+        server,
+        fetch=conn.compute.get_server,
+        what=f"server '{server.id}'",
+        status="ACTIVE",
+        failures=["ERROR"],
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        cancel_event=cancel_event,
+    )
     return server.id
 
 
@@ -363,6 +604,7 @@ def ensure_volume_from_image(
     poll_interval_seconds: int = 5,
     retries: int = 2,
     retry_delay_seconds: int = 3,
+    cancel_event: threading.Event | None = None,
 ) -> str:
     if existing_volume_id:
         existing = conn.block_storage.find_volume(existing_volume_id, ignore_missing=True)
@@ -380,9 +622,10 @@ def ensure_volume_from_image(
         # reflects the provisioned disk capacity needed by Cinder.
         virtual_size = int(getattr(image, "virtual_size", 0) or 0)
         min_disk_gb = int(getattr(image, "min_disk", 0) or 0)
+        # Round up to whole GiB with integer math (no float division).
         bytes_gb = max(
-            int(ceil(image_size / (1024 ** 3))) if image_size > 0 else 0,
-            int(ceil(virtual_size / (1024 ** 3))) if virtual_size > 0 else 0,
+            (max(0, image_size) + _GB - 1) >> 30,
+            (max(0, virtual_size) + _GB - 1) >> 30,
         )
         size_gb = max(1, min_disk_gb, bytes_gb)
 
@@ -397,19 +640,18 @@ def ensure_volume_from_image(
         ),
     )
 
-    deadline = time.monotonic() + timeout_seconds
-    while time.monotonic() < deadline:
-        current = conn.block_storage.get_volume(volume.id)
-        status = str(getattr(current, "status", "")).lower()
-        if status == "available":
-            return current.id
-        if status in {"error", "error_extending"}:
-            raise OpenStackDeploymentError(
-                f"Volume '{volume_name}' entered terminal status '{status}'."
-            )
-        time.sleep(max(1, poll_interval_seconds))
-
-    raise OpenStackDeploymentError(f"Timed out waiting for volume '{volume_name}' to become available.")
+    available = _wait_for_status(
+        conn.block_storage.wait_for_status,
+        volume,
+        fetch=conn.block_storage.get_volume,
+        what=f"volume '{volume_name}'",
+        status="available",
+        failures=["error", "error_extending"],
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        cancel_event=cancel_event,
+    )
+    return available.id
 
 
 def ensure_empty_volume(
@@ -422,6 +664,7 @@ def ensure_empty_volume(
     poll_interval_seconds: int = 5,
     retries: int = 2,
     retry_delay_seconds: int = 3,
+    cancel_event: threading.Event | None = None,
 ) -> str:
     if size_gb < 1:
         raise OpenStackDeploymentError(f"Volume '{volume_name}' size must be >= 1GB.")
@@ -445,19 +688,18 @@ def ensure_empty_volume(
         ),
     )
 
-    deadline = time.monotonic() + timeout_seconds
-    while time.monotonic() < deadline:
-        current = conn.block_storage.get_volume(volume.id)
-        status = str(getattr(current, "status", "")).lower()
-        if status == "available":
-            return current.id
-        if status in {"error", "error_extending"}:
-            raise OpenStackDeploymentError(
-                f"Volume '{volume_name}' entered terminal status '{status}'."
-            )
-        time.sleep(max(1, poll_interval_seconds))
-
-    raise OpenStackDeploymentError(f"Timed out waiting for volume '{volume_name}' to become available.")
+    available = _wait_for_status(
+        conn.block_storage.wait_for_status,
+        volume,
+        fetch=conn.block_storage.get_volume,
+        what=f"volume '{volume_name}'",
+        status="available",
+        failures=["error", "error_extending"],
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        cancel_event=cancel_event,
+    )
+    return available.id
 
 
 def attach_volume_to_server(
@@ -491,20 +733,21 @@ def verify_server_active(
     server_id: str,
     timeout_seconds: int = 900,
     poll_interval_seconds: int = 10,
+    cancel_event: threading.Event | None = None,
 ) -> str:
-    deadline = time.monotonic() + timeout_seconds
-    while time.monotonic() < deadline:
-        server = conn.compute.get_server(server_id)
-        status = str(getattr(server, "status", "")).upper()
-        if status == "ACTIVE":
-            return status
-        if status == "ERROR":
-            raise OpenStackDeploymentError(f"Server '{server_id}' entered ERROR state.")
-        time.sleep(max(1, poll_interval_seconds))
-
-    raise OpenStackDeploymentError(
-        f"Timed out waiting for server '{server_id}' to reach ACTIVE state."
+    server = conn.compute.get_server(server_id)
+    active = _wait_for_status(
+        conn.compute.wait_for_server,
+        server,
+        fetch=conn.compute.get_server,
+        what=f"server '{server_id}'",
+        status="ACTIVE",
+        failures=["ERROR"],
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        cancel_event=cancel_event,
     )
+    return str(getattr(active, "status", "ACTIVE")).upper()
 
 
 def delete_server_if_exists(conn, server_id: str) -> str:
@@ -534,9 +777,50 @@ def delete_volume_if_exists(conn, volume_id: str) -> str:
     return "deleted"
 
 
+def cleanup_resources(
+    conn,
+    server_ids: Iterable[str] = (),
+    image_ids: Iterable[str] = (),
+    volume_ids: Iterable[str] = (),
+    max_workers: int = 8,
+) -> dict[str, dict[str, str]]:
+    """Delete servers, volumes and images concurrently; never raises per resource.
+
+    Servers are removed first so their volumes are detached before Cinder deletes run.
+    Each id maps to `deleted`, `not_found` or `error: <message>`.
+    """
+    results: dict[str, dict[str, str]] = {"servers": {}, "volumes": {}, "images": {}}
+
+    def _delete(fn: Callable[[Any, str], str], resource_id: str) -> str:
+        try:
+            return fn(conn, resource_id)
+        except Exception as exc:  # noqa: BLE001
+            return f"error: {exc}"
+
+    phases = [
+        [("servers", delete_server_if_exists, rid) for rid in dict.fromkeys(server_ids)],
+        [("volumes", delete_volume_if_exists, rid) for rid in dict.fromkeys(volume_ids)]
+        + [("images", delete_image_if_exists, rid) for rid in dict.fromkeys(image_ids)],
+    ]
+    for phase in phases:
+        if not phase:
+            continue
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(phase)))) as pool:
+            futures = [(kind, rid, pool.submit(_delete, fn, rid)) for kind, fn, rid in phase]
+            for kind, rid, future in futures:
+                results[kind][rid] = future.result()
+    return results
+
+
+@lru_cache(maxsize=4096)
+def _openstack_base_name(vm_name: str, job_id: int) -> str:
+    return f"vm-migrator-{job_id}-{_sanitize_name(vm_name)}"
+
+
 def build_openstack_names(vm_name: str, job_id: int) -> dict[str, str]:
-    safe = _sanitize_name(vm_name)
+    # The cached part is the immutable base name; callers get a fresh dict each time.
+    base = _openstack_base_name(vm_name, job_id)
     return {
-        "image_name": f"vm-migrator-{job_id}-{safe}",
-        "server_name": f"vm-migrator-{job_id}-{safe}",
+        "image_name": base,
+        "server_name": base,
     }
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework import serializers
 
 from .models import DiscoveredVM, MigrationJob, OpenstackEndpointSession, VmwareEndpointSession
 from .openstack_client import OpenStackClient, OpenStackClientError
 
+_FORBIDDEN_DISK_LAYOUT_MODES = frozenset({"merge", "concat", "concatenate"})
+
+
+@lru_cache(maxsize=32)
+def _is_forbidden_disk_layout_mode(mode: str) -> bool:
+    # Bulk selections usually repeat the same few mode strings.
+    return mode.casefold() in _FORBIDDEN_DISK_LAYOUT_MODES
+
+
+def _openstack_index_cache_key(kind: str, session_id: int) -> str:
+    """Cache key for a flavor/network index shared across requests of one endpoint session."""
+    return f"openstack:{kind}:{session_id}"
+
 
 class NetworkOverrideSerializer(serializers.Serializer):
     network_id = serializers.CharField(max_length=255, required=False, allow_blank=True)
@@ -29,10 +45,7 @@ class VMOverridesSerializer(serializers.Serializer):
     disk_layout_mode = serializers.CharField(required=False, allow_blank=True)
 
     def validate(self, attrs):
-        disk_layout_mode = str(attrs.get("disk_layout_mode", "") or "").strip().lower()
-        disk_merge = bool(attrs.get("disk_merge", False))
-
-        if disk_merge or disk_layout_mode in {"merge", "concat", "concatenate"}:
+        if attrs.get("disk_merge") or _is_forbidden_disk_layout_mode(attrs.get("disk_layout_mode") or ""):
             raise serializers.ValidationError(
                 "Disk concatenation/merge is not allowed. Disk architecture must remain unchanged "
                 "(1-to-1: same number of disks, same order, no merge)."
@@ -51,53 +64,75 @@ class CreateMigrationFromVMwareSerializer(serializers.Serializer):
     openstack_endpoint_session_id = serializers.IntegerField(min_value=1)
     vms = SelectedVMSerializer(many=True, allow_empty=False)
 
-    def validate_vms(self, value):
-        vmware_endpoint_session_id = self.initial_data.get("vmware_endpoint_session_id")
-        openstack_endpoint_session_id = self.initial_data.get("openstack_endpoint_session_id")
-
-        vmware_session = VmwareEndpointSession.objects.filter(id=vmware_endpoint_session_id).first()
+    def validate(self, attrs):
+        # Runs after field validation, so both session ids are already coerced ints.
+        # Every error is reported under "vms", in the order the API has always checked them.
+        # Callers only need the VMware session id; skip loading its credentials and test log.
+        vmware_session = (
+            VmwareEndpointSession.objects.filter(id=attrs["vmware_endpoint_session_id"]).only("id").first()
+        )
         if vmware_session is None:
-            raise serializers.ValidationError("Invalid vmware_endpoint_session_id.")
-        openstack_session = OpenstackEndpointSession.objects.filter(id=openstack_endpoint_session_id).first()
+            raise serializers.ValidationError({"vms": "Invalid vmware_endpoint_session_id."})
+        openstack_session = (
+            OpenstackEndpointSession.objects.filter(id=attrs["openstack_endpoint_session_id"])
+            .defer("last_test_message")
+            .first()
+        )
         if openstack_session is None:
-            raise serializers.ValidationError("Invalid openstack_endpoint_session_id.")
+            raise serializers.ValidationError({"vms": "Invalid openstack_endpoint_session_id."})
 
         self.context["vmware_endpoint_session"] = vmware_session
         self.context["openstack_endpoint_session"] = openstack_session
 
-        keys = [(item["name"], item["source"]) for item in value]
-        duplicates = [k for k, count in Counter(keys).items() if count > 1]
+        seen = set()
+        duplicates = []
+        for item in attrs["vms"]:
+            key = (item["name"], item["source"])
+            if key not in seen:
+                seen.add(key)
+            elif key not in duplicates:
+                duplicates.append(key)
         if duplicates:
             duplicate_repr = [{"name": n, "source": s} for n, s in duplicates]
             raise serializers.ValidationError(
-                f"Duplicate VM selections are not allowed: {duplicate_repr}"
+                {"vms": f"Duplicate VM selections are not allowed: {duplicate_repr}"}
             )
 
+        try:
+            attrs["vms"] = self._resolve_selected_vms(attrs["vms"], vmware_session, openstack_session)
+        except serializers.ValidationError as exc:
+            # Keep reporting selection problems under "vms", as field validation did.
+            raise serializers.ValidationError({"vms": exc.detail}) from exc
+        return attrs
+
+    def _resolve_selected_vms(self, value, vmware_session, openstack_session):
+        # One query for the whole selection; (name, source) pairs are resolved in memory.
+        # Only ids are needed downstream, so skip building model instances.
+        candidates = DiscoveredVM.objects.filter(
+            vmware_endpoint_session_id=vmware_session.id,
+            source__in={item["source"] for item in value},
+            name__in={item["name"] for item in value},
+        ).values_list("id", "name", "source")
+        by_key = {(name, source): vm_id for vm_id, name, source in candidates}
+
+        # Single pass: resolve discovery rows, normalize overrides (empty values are
+        # dropped to keep job metadata concise) and collect ids for OpenStack checks.
         discovered_vm_map = {}
         missing = []
+        flavor_ids = set()
+        network_ids = set()
+        fixed_ip_entries = []
         for item in value:
             key = (item["name"], item["source"])
-            vm = DiscoveredVM.objects.filter(
-                name=item["name"],
-                source=item["source"],
-                vmware_endpoint_session_id=vmware_session.id,
-            ).first()
-            if vm is None:
+            vm_id = by_key.get(key)
+            if vm_id is None:
                 missing.append({"name": item["name"], "source": item["source"]})
             else:
-                discovered_vm_map[key] = vm
+                discovered_vm_map[key] = vm_id
 
-        if missing:
-            raise serializers.ValidationError(
-                f"Selected VMs not found in discovery data: {missing}"
-            )
-
-        # Normalize empty override values to keep job metadata concise and predictable.
-        normalized = []
-        for item in value:
+            # Child serializers already coerced types, trimmed strings and enforced min values.
             override_payload = item.get("overrides")
-            if not isinstance(override_payload, dict):
-                normalized.append(item)
+            if override_payload is None:
                 continue
 
             cleaned = {}
@@ -107,77 +142,78 @@ class CreateMigrationFromVMwareSerializer(serializers.Serializer):
             extra_disks = override_payload.get("extra_disks_gb")
             network = override_payload.get("network")
 
-            if isinstance(flavor_id, str) and flavor_id.strip():
-                cleaned["flavor_id"] = flavor_id.strip()
-            if isinstance(cpu, int):
+            if flavor_id:
+                cleaned["flavor_id"] = flavor_id
+                flavor_ids.add(flavor_id)
+            if cpu is not None:
                 cleaned["cpu"] = cpu
-            if isinstance(ram, int):
+            if ram is not None:
                 cleaned["ram"] = ram
-            if isinstance(extra_disks, list):
-                cleaned["extra_disks_gb"] = [int(v) for v in extra_disks if isinstance(v, int) and v > 0]
-            if isinstance(network, dict):
+            if extra_disks is not None:
+                cleaned["extra_disks_gb"] = list(extra_disks)
+            if network:
                 network_id = network.get("network_id")
                 network_name = network.get("network_name")
                 fixed_ip = network.get("fixed_ip")
                 cleaned_network = {}
-                if isinstance(network_id, str) and network_id.strip():
-                    cleaned_network["network_id"] = network_id.strip()
-                if isinstance(network_name, str) and network_name.strip():
-                    cleaned_network["network_name"] = network_name.strip()
-                if isinstance(fixed_ip, str) and fixed_ip.strip():
-                    cleaned_network["fixed_ip"] = fixed_ip.strip()
+                if network_id:
+                    cleaned_network["network_id"] = network_id
+                    network_ids.add(network_id)
+                if network_name:
+                    cleaned_network["network_name"] = network_name
+                if fixed_ip:
+                    cleaned_network["fixed_ip"] = fixed_ip
+                    fixed_ip_entries.append((item["name"], network_id or None, network_name or None, fixed_ip))
                 if cleaned_network:
                     cleaned["network"] = cleaned_network
 
-            next_item = {**item}
+            # Items are freshly built validated dicts, so normalize them in place.
             if cleaned:
-                next_item["overrides"] = cleaned
+                item["overrides"] = cleaned
             else:
-                next_item.pop("overrides", None)
-            normalized.append(next_item)
+                item.pop("overrides", None)
 
-        value = normalized
-
-        flavor_ids = set()
-        network_ids = set()
-        for item in value:
-            overrides = item.get("overrides") or {}
-            if not isinstance(overrides, dict):
-                continue
-            flavor_id = overrides.get("flavor_id")
-            if isinstance(flavor_id, str) and flavor_id.strip():
-                flavor_ids.add(flavor_id.strip())
-            network = overrides.get("network") or {}
-            if isinstance(network, dict):
-                network_id = network.get("network_id")
-                if isinstance(network_id, str) and network_id.strip():
-                    network_ids.add(network_id.strip())
+        if missing:
+            raise serializers.ValidationError(
+                f"Selected VMs not found in discovery data: {missing}"
+            )
 
         fixed_ip_checks = []
-        has_fixed_ip = any(
-            isinstance((item.get("overrides") or {}).get("network"), dict)
-            and (item.get("overrides") or {}).get("network", {}).get("fixed_ip")
-            for item in value
-        )
+        # Plain bulk selections (no flavor/network/fixed IP overrides) never touch OpenStack.
+        needs_openstack = bool(flavor_ids or network_ids or fixed_ip_entries)
 
-        if flavor_ids or network_ids or has_fixed_ip:
+        if needs_openstack:
             try:
-                client = OpenStackClient(auth_config=openstack_session.to_connect_kwargs())
-                available_flavors = {item.get("id") for item in client.list_flavors() if item.get("id")}
-                networks_payload = client.list_networks()
-                available_networks = {item.get("id") for item in networks_payload if item.get("id")}
-                networks_by_name: dict[str, list[str]] = {}
-                for item in networks_payload:
-                    name = item.get("name")
-                    net_id = item.get("id")
-                    if not name or not net_id:
-                        continue
-                    networks_by_name.setdefault(name, []).append(net_id)
+                flavors_key = _openstack_index_cache_key("flavor-ids", openstack_session.id)
+                networks_key = _openstack_index_cache_key("network-index", openstack_session.id)
+                indexes = cache.get_many([flavors_key, networks_key])
+
+                # Building the client authenticates against Keystone, so only do it on a
+                # cache miss or when fixed IPs have to be checked live.
+                client = None
+                if len(indexes) < 2 or fixed_ip_entries:
+                    client = OpenStackClient(auth_config=openstack_session.to_connect_kwargs())
+
+                fetchers = {}
+                if flavors_key not in indexes:
+                    fetchers[flavors_key] = client.list_flavor_ids
+                if networks_key not in indexes:
+                    fetchers[networks_key] = client.list_network_index
+                if fetchers:
+                    # The listings are independent round trips; fetch them concurrently.
+                    with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+                        futures = {key: pool.submit(fetch) for key, fetch in fetchers.items()}
+                        fetched = {key: future.result() for key, future in futures.items()}
+                    cache.set_many(fetched, timeout=settings.OPENSTACK_LISTING_CACHE_SECONDS)
+                    indexes.update(fetched)
+
+                available_flavors = indexes[flavors_key]
+                available_networks, networks_by_name = indexes[networks_key]
             except OpenStackClientError as exc:
                 raise serializers.ValidationError(f"OpenStack validation failed: {exc}") from exc
 
-            invalid_flavors = sorted([fid for fid in flavor_ids if fid not in available_flavors])
-            invalid_networks = sorted([nid for nid in network_ids if nid not in available_networks])
+            invalid_flavors = sorted(flavor_ids - available_flavors)
+            invalid_networks = sorted(network_ids - available_networks)
             if invalid_flavors or invalid_networks:
                 raise serializers.ValidationError(
                     {
@@ -186,59 +222,51 @@ class CreateMigrationFromVMwareSerializer(serializers.Serializer):
                     }
                 )
 
-            for item in value:
-                overrides = item.get("overrides") or {}
-                if not isinstance(overrides, dict):
-                    continue
-                network = overrides.get("network") or {}
-                if not isinstance(network, dict):
-                    continue
-                fixed_ip = network.get("fixed_ip")
-                if not fixed_ip:
-                    continue
-
-                network_id = network.get("network_id")
-                network_name = network.get("network_name")
+            pending_fixed_ips = []
+            for vm_name, network_id, network_name, fixed_ip in fixed_ip_entries:
                 resolved_network_id = None
 
-                if isinstance(network_id, str) and network_id.strip():
-                    resolved_network_id = network_id.strip()
-                elif isinstance(network_name, str) and network_name.strip():
-                    matches = networks_by_name.get(network_name.strip(), [])
+                if network_id:
+                    resolved_network_id = network_id
+                elif network_name:
+                    matches = networks_by_name.get(network_name, [])
                     if len(matches) == 1:
                         resolved_network_id = matches[0]
                     elif len(matches) > 1:
                         fixed_ip_checks.append(
-                            f"VM '{item.get('name')}' has ambiguous network name '{network_name}'. Select a network explicitly."
+                            f"VM '{vm_name}' has ambiguous network name '{network_name}'. Select a network explicitly."
                         )
                         continue
                     else:
                         fixed_ip_checks.append(
-                            f"VM '{item.get('name')}' network '{network_name}' not found for fixed IP {fixed_ip}."
+                            f"VM '{vm_name}' network '{network_name}' not found for fixed IP {fixed_ip}."
                         )
                         continue
                 else:
                     fixed_ip_checks.append(
-                        f"VM '{item.get('name')}' must select a network to use fixed IP {fixed_ip}."
+                        f"VM '{vm_name}' must select a network to use fixed IP {fixed_ip}."
                     )
                     continue
 
+                pending_fixed_ips.append((vm_name, resolved_network_id, fixed_ip))
+
+            if pending_fixed_ips:
                 try:
-                    valid, reason = client.validate_fixed_ip(
-                        network_id=resolved_network_id,
-                        fixed_ip=str(fixed_ip),
+                    results = client.validate_fixed_ips(
+                        [(network_id, str(fixed_ip)) for _, network_id, fixed_ip in pending_fixed_ips]
                     )
                 except OpenStackClientError as exc:
                     raise serializers.ValidationError(f"OpenStack validation failed: {exc}") from exc
-                if not valid:
-                    fixed_ip_checks.append(
-                        f"VM '{item.get('name')}' fixed IP {fixed_ip} invalid: {reason}"
-                    )
+                for (vm_name, _, fixed_ip), (valid, reason) in zip(pending_fixed_ips, results):
+                    if not valid:
+                        fixed_ip_checks.append(
+                            f"VM '{vm_name}' fixed IP {fixed_ip} invalid: {reason}"
+                        )
 
         if fixed_ip_checks:
             raise serializers.ValidationError({"fixed_ip": fixed_ip_checks})
 
-        # Stash for the view so we do not query again.
+        # Stash for the view so we do not query again: (name, source) -> DiscoveredVM id.
         self.context["discovered_vm_map"] = discovered_vm_map
         return value
 
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
+import errno
+import io
 import logging
 import os
 import re
+import select
 import shutil
+import stat
 import subprocess
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from urllib.parse import quote
 
 from celery import shared_task
 from django.conf import settings
-from django.db import transaction
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import connections, router, transaction
 from django.utils import timezone
 
 from .ansible_runner import AnsibleRunner, AnsibleRunnerError
 from .conversion import ConversionPlanningError, ConversionPlan, plan_vmware_conversion
-from .disk_formats import DiskConversionError, convert_to_openstack_compatible, detect_disk_format
+from .disk_formats import (
+    DiskConversionError,
+    DiskFormatError,
+    convert_to_openstack_compatible,
+    convert_with_qemu_img,
+    detect_disk_format,
+)
 from .models import (
     DiscoveredVM,
     InvalidTransitionError,
@@ -27,18 +45,17 @@ from .models import (
     VmwareEndpointSession,
 )
 from .openstack_deployment import (
+    FlavorChoice,
     OpenStackDeploymentError,
     attach_volume_to_server,
+    boot_and_wait_active,
     build_openstack_names,
-    connect_openstack,
-    delete_image_if_exists,
-    delete_server_if_exists,
-    delete_volume_if_exists,
-    ensure_server_booted_from_volume,
+    cleanup_resources,
     ensure_empty_volume,
     ensure_uploaded_image,
     ensure_volume_from_image,
     get_flavor_choice_by_id,
+    get_openstack_connection,
     map_vmware_to_flavor,
     select_default_network,
     verify_server_active,
@@ -48,6 +65,75 @@ from .vmware_client import ESXiVMwareClient, VMwareClientError, WorkstationVMwar
 
 logger = logging.getLogger(__name__)
 
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]")
+# str.translate equivalent of _SANITIZE_RE for the common all-ASCII case.
+_SANITIZE_ASCII_TABLE = str.maketrans(
+    {chr(c): "-" for c in range(128) if not (chr(c).isalnum() or chr(c) in "._-")}
+)
+
+# virt-inspector results keyed by (path, mtime_ns, size); see _inspect_disk_for_system_filesystem.
+_DISK_INSPECTION_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+_DISK_INSPECTION_CACHE_LOCK = threading.Lock()
+_DISK_INSPECTION_CACHE_MAX = 256
+
+
+@dataclass(frozen=True)
+class _ConversionSettings:
+    """Conversion settings read once per process instead of on every task."""
+
+    disk_inspect_timeout_seconds: int
+    disk_inspect_strategy: str
+    output_disk_format: str
+    qemu_img_timeout_seconds: int
+    qemu_img_parallelism: int
+    virt_v2v_timeout_seconds: int
+    virt_v2v_log_tail_lines: int
+    enable_rollback: bool
+    vmware_require_no_snapshots: bool
+    enable_real_conversion: bool
+    enable_ansible_conversion: bool
+    enable_artifact_backup: bool
+    artifact_backup_required: bool
+    artifact_backup_use_qemu_img: bool
+    artifact_backup_allow_hardlink: bool
+    artifact_backup_parallelism: int
+    artifact_backup_root: Path
+    enable_openstack_deployment: bool
+
+
+@lru_cache(maxsize=1)
+def _conversion_settings() -> _ConversionSettings:
+    return _ConversionSettings(
+        disk_inspect_timeout_seconds=int(getattr(settings, "DISK_INSPECT_TIMEOUT_SECONDS", 90)),
+        disk_inspect_strategy=str(getattr(settings, "DISK_INSPECT_STRATEGY", "sda_first")).strip().lower(),
+        output_disk_format=str(getattr(settings, "OPENSTACK_OUTPUT_DISK_FORMAT", "qcow2")).strip().lower() or "qcow2",
+        qemu_img_timeout_seconds=int(getattr(settings, "QEMU_IMG_TIMEOUT_SECONDS", 3600)),
+        qemu_img_parallelism=int(getattr(settings, "QEMU_IMG_PARALLELISM", 4)),
+        virt_v2v_timeout_seconds=int(getattr(settings, "VIRT_V2V_TIMEOUT_SECONDS", 7200)),
+        virt_v2v_log_tail_lines=int(getattr(settings, "VIRT_V2V_LOG_TAIL_LINES", 400)),
+        enable_rollback=bool(getattr(settings, "ENABLE_ROLLBACK", True)),
+        vmware_require_no_snapshots=bool(getattr(settings, "VMWARE_REQUIRE_NO_SNAPSHOTS", True)),
+        enable_real_conversion=bool(getattr(settings, "ENABLE_REAL_CONVERSION", False)),
+        enable_ansible_conversion=bool(getattr(settings, "ENABLE_ANSIBLE_CONVERSION", False)),
+        enable_artifact_backup=bool(getattr(settings, "ENABLE_ARTIFACT_BACKUP", False)),
+        artifact_backup_required=bool(getattr(settings, "ARTIFACT_BACKUP_REQUIRED", False)),
+        artifact_backup_use_qemu_img=bool(getattr(settings, "ARTIFACT_BACKUP_USE_QEMU_IMG", False)),
+        artifact_backup_allow_hardlink=bool(getattr(settings, "ARTIFACT_BACKUP_ALLOW_HARDLINK", False)),
+        artifact_backup_parallelism=int(getattr(settings, "ARTIFACT_BACKUP_PARALLELISM", 4)),
+        artifact_backup_root=Path(
+            getattr(settings, "ARTIFACT_BACKUP_DIR", str(Path(settings.MIGRATION_OUTPUT_DIR) / "backups"))
+        ).expanduser(),
+        enable_openstack_deployment=bool(getattr(settings, "ENABLE_OPENSTACK_DEPLOYMENT", False)),
+    )
+
+
+def _clear_conversion_settings(**kwargs: Any) -> None:
+    # override_settings() in tests must not see a stale snapshot.
+    _conversion_settings.cache_clear()
+
+
+setting_changed.connect(_clear_conversion_settings)
+
 
 class ConversionExecutionError(Exception):
     """Raised when real virt-v2v execution fails."""
@@ -72,18 +158,47 @@ def celery_ping():
 
 
 def _truncate_log(text: str, limit: int = 12000) -> str:
+    """Keep the last ``limit`` characters; tool errors are at the end of their output."""
+    text = text or ""
     if len(text) <= limit:
         return text
-    return text[:limit] + "\n...[truncated]"
+    return "...[truncated]\n" + text[-limit:]
+
+
+def _truncate_log_bytes(data: bytes, limit: int = 12000) -> str:
+    """Decode at most the last ``limit`` bytes of captured output, like ``_truncate_log``.
+
+    The discarded head is never decoded.
+    """
+    if len(data) <= limit:
+        return data.decode("utf-8", "replace")
+    return "...[truncated]\n" + str(memoryview(data)[-limit:], "utf-8", "replace")
 
 
 def _sanitize_name(value: str) -> str:
-    clean = re.sub(r"[^A-Za-z0-9._-]", "-", value).strip("-._")
+    if value.isascii():
+        clean = value.translate(_SANITIZE_ASCII_TABLE)
+    else:
+        clean = _SANITIZE_RE.sub("-", value)
+    clean = clean.strip("-._")
     return clean or "vm"
 
 
-def _find_discovered_vm_for_job(job: MigrationJob) -> DiscoveredVM:
-    metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
+def _safe_meta(job: MigrationJob) -> dict[str, Any]:
+    """The job's conversion metadata, or an empty dict when it is unset or malformed."""
+    metadata = job.conversion_metadata
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _dict_or(mapping: dict[str, Any], key: str) -> dict[str, Any]:
+    """``mapping[key]`` when it is a dict, otherwise a new empty dict."""
+    value = mapping.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def _find_discovered_vm_for_job(job: MigrationJob, *, defer_inventory: bool = False) -> DiscoveredVM:
+    """The DiscoveredVM a job was created from; ``defer_inventory`` leaves out the disks/metadata JSON."""
+    metadata = _safe_meta(job)
     selected_source = metadata.get("selected_source")
     vmware_endpoint_session_id = metadata.get("selected_vmware_endpoint_session_id")
 
@@ -92,59 +207,65 @@ def _find_discovered_vm_for_job(job: MigrationJob) -> DiscoveredVM:
         qs = qs.filter(source=selected_source)
     if isinstance(vmware_endpoint_session_id, int):
         qs = qs.filter(vmware_endpoint_session_id=vmware_endpoint_session_id)
+    if defer_inventory:
+        qs = qs.defer("disks", "metadata")
 
-    count = qs.count()
-    if count == 0:
+    # Two rows are enough to tell "exactly one" from "ambiguous" in a single query.
+    matches = list(qs[:2])
+    if not matches:
         raise ConversionPlanningError(
             f"No DiscoveredVM found for vm_name='{job.vm_name}' source='{selected_source}'."
         )
-    if count > 1:
+    if len(matches) > 1:
         sources = list(qs.values_list("source", flat=True))
         raise ConversionPlanningError(
             f"Ambiguous DiscoveredVM reference for vm_name='{job.vm_name}'. Matches sources={sources}."
         )
-    return qs.first()
+    return matches[0]
 
 
-def _validate_workstation_paths(input_disks: list[str], output_path: str) -> dict[str, Any]:
-    errors: list[str] = []
-    checked: list[dict[str, Any]] = []
-    total_input_size = 0
+def _probe_input_disk(disk: str) -> dict[str, Any]:
+    disk_path = Path(disk).expanduser()
+    # A single stat answers both "exists" and "size"; access() is only needed for real files.
+    try:
+        size_bytes = disk_path.stat().st_size
+    except OSError:
+        return {"path": str(disk_path), "exists": False, "readable": False, "size_bytes": None}
+    return {
+        "path": str(disk_path),
+        "exists": True,
+        "readable": os.access(disk_path, os.R_OK),
+        "size_bytes": size_bytes,
+    }
 
-    for disk in input_disks:
-        disk_path = Path(disk).expanduser()
-        exists = disk_path.exists()
-        readable = os.access(disk_path, os.R_OK) if exists else False
-        size_bytes = None
 
-        if exists:
-            try:
-                size_bytes = disk_path.stat().st_size
-                total_input_size += size_bytes
-            except OSError:
-                size_bytes = None
+def _validate_workstation_paths(input_disks: list[str], output_path: str) -> dict[str, Any]:
+    errors: list[str] = []
 
-        checked.append(
-            {
-                "path": str(disk_path),
-                "exists": exists,
-                "readable": readable,
-                "size_bytes": size_bytes,
-            }
-        )
+    if len(input_disks) > 1:
+        # Probes are independent IO; on slow/remote storage run them concurrently.
+        # map() keeps results in input order.
+        with ThreadPoolExecutor(max_workers=min(16, len(input_disks))) as pool:
+            checked = list(pool.map(_probe_input_disk, input_disks))
+    else:
+        checked = [_probe_input_disk(disk) for disk in input_disks]
 
-        if not exists:
-            errors.append(f"Missing disk path: {disk_path}")
-        elif not readable:
-            errors.append(f"Disk path is not readable: {disk_path}")
+    total_input_size = 0
+    for item in checked:
+        if not item["exists"]:
+            errors.append(f"Missing disk path: {item['path']}")
+            continue
+        total_input_size += item["size_bytes"]
+        if not item["readable"]:
+            errors.append(f"Disk path is not readable: {item['path']}")
 
     output_dir = Path(output_path).expanduser().parent
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
     except PermissionError as exc:
         errors.append(f"Output directory permission error: {output_dir} ({exc})")
-
-    if output_dir.exists():
+    else:
+        # mkdir(exist_ok=True) returning means the directory exists; no separate exists() stat.
         if not os.access(output_dir, os.W_OK):
             errors.append(f"Output directory is not writable: {output_dir}")
         else:
@@ -170,7 +291,13 @@ def _ensure_libguestfs_kernel_readable() -> None:
     On some hardened installs, `/boot/vmlinuz-*` is mode 0600 (root-only) which
     causes supermin to fail and virt-v2v to exit early.
     """
-    release = os.uname().release
+    _check_libguestfs_kernel(os.uname().release)
+
+
+@lru_cache(maxsize=1)
+def _check_libguestfs_kernel(release: str) -> None:
+    # Only a passing check is cached (raising skips the cache), so a fixed
+    # permission is picked up on the next task without restarting the worker.
     kernel = Path("/boot") / f"vmlinuz-{release}"
     if kernel.exists() and not os.access(kernel, os.R_OK):
         raise ConversionPlanningError(
@@ -187,6 +314,7 @@ def _build_esxi_libvirt_uri() -> str:
     return _build_esxi_libvirt_uri_with_values(host=host, username=username, insecure=insecure)
 
 
+@lru_cache(maxsize=16)
 def _build_esxi_libvirt_uri_with_values(*, host: str, username: str, insecure: bool) -> str:
     if not host or not username:
         raise ConversionPlanningError("VMWARE_ESXI_HOST and VMWARE_ESXI_USERNAME are required for ESXi conversion.")
@@ -208,40 +336,79 @@ def _write_password_file(tmp_dir: Path, password: str) -> Path:
 
 
 def _normalize_disk_artifact_path(p: Path) -> Path:
+    """Give a suffix-less virt-v2v artifact a ``.qcow2`` name, never clobbering an existing file.
+
+    link() + unlink() instead of rename()/os.replace(): those silently overwrite an
+    existing target, so they would need an exists() check first, which races with a
+    concurrent worker; link() fails atomically with FileExistsError instead.
+    """
     if p.suffix != "":
         return p
 
     renamed = p.with_name(p.name + ".qcow2")
-    if not renamed.exists():
+    try:
+        os.link(p, renamed)
+    except FileExistsError:
+        return renamed
+    except OSError:
+        # Filesystem without hard links: plain rename, still never clobbering an existing file.
+        if renamed.exists():
+            return renamed
         try:
             p.rename(renamed)
             return renamed
         except OSError:
             return p
+    try:
+        p.unlink()
+    except OSError:
+        # The .qcow2 link already exists; a leftover suffix-less name is harmless.
+        pass
     return renamed
 
 
-def _find_output_qcow2_paths(output_path: str, vm_name: str) -> list[Path]:
+def _find_output_qcow2_paths(output_path: str, vm_name: str) -> list[tuple[Path, int]]:
+    """Return ``(path, size_bytes)`` for each conversion artifact, sorted by name."""
     expected = Path(output_path)
     output_dir = expected.parent
     if not output_dir.exists():
         raise ConversionExecutionError(f"Output directory not found after conversion: {output_dir}")
 
-    candidates: list[Path] = []
+    candidates: list[tuple[Path, int]] = []
 
-    if expected.exists() and expected.is_file():
-        candidates.append(expected)
-
-    for pattern in [f"{vm_name}*.qcow2", f"{vm_name}-sd*", f"{vm_name}*"]:
-        for p in output_dir.glob(pattern):
-            if not p.is_file():
+    try:
+        expected_stat = expected.stat()
+    except OSError:
+        expected_stat = None
+    if expected_stat is not None and stat.S_ISREG(expected_stat.st_mode):
+        candidates.append((expected, int(expected_stat.st_size)))
+
+    # One directory pass; `{vm_name}*` covers the `*.qcow2` and `-sd*` virt-v2v names.
+    # DirEntry.is_file() reuses the d_type from readdir instead of stat-ing each entry.
+    # Sizes are taken here so callers do not stat the artifacts again; a path changed by
+    # normalization is re-stat'ed below, as it may name a different, pre-existing file.
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith(vm_name) or not entry.is_file():
                 continue
-            if p.suffix.lower() == ".xml":
+            if entry.name.lower().endswith(".xml"):
                 continue
-            candidates.append(p)
+            try:
+                size_bytes = int(entry.stat().st_size)
+            except OSError:
+                size_bytes = 0
+            candidates.append((Path(entry.path), size_bytes))
 
-    normalized = [_normalize_disk_artifact_path(p) for p in candidates]
-    unique = sorted({str(p): p for p in normalized}.values(), key=lambda x: x.name)
+    normalized = {}
+    for scanned, size_bytes in candidates:
+        p = _normalize_disk_artifact_path(scanned)
+        if p != scanned:
+            try:
+                size_bytes = int(p.stat().st_size)
+            except OSError:
+                size_bytes = 0
+        normalized[str(p)] = (p, size_bytes)
+    unique = sorted(normalized.values(), key=lambda x: x[0].name)
     if unique:
         return unique
 
@@ -250,12 +417,17 @@ def _find_output_qcow2_paths(output_path: str, vm_name: str) -> list[Path]:
     )
 
 
+def _is_sda_artifact(p: Path) -> bool:
+    """virt-v2v names the first (boot) disk ``<vm>-sda``."""
+    return p.name.endswith("-sda") or p.name.endswith("-sda.qcow2")
+
+
 def _select_primary_disk(paths: list[Path], vm_name: str) -> Path:
     if not paths:
         raise ConversionExecutionError(f"No conversion artifacts found for VM '{vm_name}'.")
 
     for p in paths:
-        if p.name.endswith("-sda") or p.name.endswith("-sda.qcow2"):
+        if _is_sda_artifact(p):
             return p
     for p in paths:
         if p.name == f"{vm_name}.qcow2":
@@ -267,12 +439,42 @@ def _inspect_disk_for_system_filesystem(path: Path) -> dict[str, Any]:
     """Best-effort OS inspection for a converted disk image.
 
     Uses virt-inspector when available to detect a root filesystem and score
-    likely system disks. Returns score=0 when undetermined.
+    likely system disks. Returns score=0 when undetermined. Successful results
+    are reused while the image's size and mtime are unchanged (retries, rollback).
     """
+    try:
+        st = path.stat()
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        cache_key = None
+
+    if cache_key is not None:
+        with _DISK_INSPECTION_CACHE_LOCK:
+            cached = _DISK_INSPECTION_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+    result = _run_disk_inspection(path)
+    if cache_key is not None and result["available"] and not result["error"]:
+        with _DISK_INSPECTION_CACHE_LOCK:
+            if len(_DISK_INSPECTION_CACHE) >= _DISK_INSPECTION_CACHE_MAX:
+                _DISK_INSPECTION_CACHE.clear()
+            _DISK_INSPECTION_CACHE[cache_key] = result
+    return dict(result)
+
+
+@lru_cache(maxsize=8)
+def _which(binary: str) -> str | None:
+    """``shutil.which`` resolved once per worker process; PATH is fixed for its lifetime."""
+    return shutil.which(binary)
+
+
+def _run_disk_inspection(path: Path) -> dict[str, Any]:
+    inspector_bin = _which("virt-inspector")
     result: dict[str, Any] = {
         "path": str(path),
         "tool": "virt-inspector",
-        "available": bool(shutil.which("virt-inspector")),
+        "available": bool(inspector_bin),
         "score": 0,
         "has_operating_system": False,
         "has_root_mount": False,
@@ -286,28 +488,27 @@ def _inspect_disk_for_system_filesystem(path: Path) -> dict[str, Any]:
 
     try:
         completed = subprocess.run(
-            ["virt-inspector", "-a", str(path)],
+            [inspector_bin, "-a", str(path)],
+            # Raw bytes: the XML parser decodes the report itself, logs are decoded only on error.
             capture_output=True,
-            text=True,
             check=False,
-            timeout=int(getattr(settings, "DISK_INSPECT_TIMEOUT_SECONDS", 90)),
+            timeout=_conversion_settings().disk_inspect_timeout_seconds,
         )
     except (OSError, subprocess.SubprocessError) as exc:
         result["error"] = str(exc)
         return result
 
     if completed.returncode != 0:
-        result["error"] = (completed.stderr or completed.stdout or "").strip()[:500]
+        result["error"] = _truncate_log_bytes(completed.stderr or completed.stdout or b"", 500).strip()
         return result
 
     try:
-        root = ET.fromstring(completed.stdout or "")
+        os_entries = _parse_inspector_operating_systems(completed.stdout or b"")
     except ET.ParseError as exc:
         result["error"] = f"invalid XML: {exc}"
         return result
 
-    os_nodes = root.findall(".//operatingsystem")
-    if not os_nodes:
+    if not os_entries:
         return result
 
     best_score = 0
@@ -316,16 +517,10 @@ def _inspect_disk_for_system_filesystem(path: Path) -> dict[str, Any]:
     has_root_mount = False
     has_boot_mount = False
 
-    for os_node in os_nodes:
-        os_name = os_node.findtext("name")
-        if isinstance(os_name, str) and os_name.strip():
-            os_names.append(os_name.strip())
+    for os_name, mountpoints in os_entries:
+        if os_name:
+            os_names.append(os_name)
 
-        mountpoints = [
-            (mp.text or "").strip()
-            for mp in os_node.findall(".//mountpoint")
-            if isinstance(mp.text, str) and mp.text.strip()
-        ]
         local_has_root = "/" in mountpoints
         local_has_boot = "/boot" in mountpoints or "/boot/efi" in mountpoints
         local_score = 40
@@ -352,8 +547,67 @@ def _inspect_disk_for_system_filesystem(path: Path) -> dict[str, Any]:
     return result
 
 
-def _order_qcow2_paths_for_boot(paths: list[Path], vm_name: str) -> tuple[list[Path], Path, int, list[dict[str, Any]]]:
-    """Detect likely boot/system disk while preserving original disk order."""
+def _parse_inspector_operating_systems(xml_data: bytes) -> list[tuple[str | None, list[str]]]:
+    """Stream virt-inspector XML into (os name, mountpoints) pairs, one per <operatingsystem>.
+
+    Elements are cleared as soon as they are consumed, so large inspector
+    reports (application lists, filesystems) never sit in memory as a full tree.
+    """
+    entries: list[tuple[str | None, list[str]]] = []
+    depth = 0
+    os_depth = None
+    os_name = None
+    mountpoints: list[str] = []
+    for event, elem in ET.iterparse(io.BytesIO(xml_data), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if elem.tag == "operatingsystem" and os_depth is None:
+                os_depth = depth
+                os_name = None
+                mountpoints = []
+            continue
+
+        if os_depth is not None:
+            text = (elem.text or "").strip()
+            if elem.tag == "name" and depth == os_depth + 1:
+                # Only the OS's own <name>; nested application names are ignored.
+                os_name = text or None
+            elif elem.tag == "mountpoint" and text:
+                mountpoints.append(text)
+            elif elem.tag == "operatingsystem" and depth == os_depth:
+                entries.append((os_name, mountpoints))
+                os_depth = None
+        depth -= 1
+        elem.clear()
+    return entries
+
+
+def _filename_only_inspection(path: Path) -> dict[str, Any]:
+    """Analysis entry for a disk that was ranked by filename without running virt-inspector."""
+    return {
+        "path": str(path),
+        "tool": "filename",
+        "available": False,
+        "skipped": True,
+        "score": 0,
+        "has_operating_system": False,
+        "has_root_mount": False,
+        "has_boot_mount": False,
+        "mountpoints": [],
+        "os_names": [],
+        "error": "",
+    }
+
+
+def _order_qcow2_paths_for_boot(
+    paths: list[Path],
+    vm_name: str,
+    disk_sizes: dict[str, int] | None = None,
+) -> tuple[list[Path], Path, int, list[dict[str, Any]]]:
+    """Detect likely boot/system disk while preserving original disk order.
+
+    ``disk_sizes`` (path string -> bytes) avoids re-stat-ing artifacts already sized by the caller.
+    """
     if not paths:
         raise ConversionExecutionError(f"No conversion artifacts found for VM '{vm_name}'.")
     if len(paths) == 1:
@@ -368,19 +622,38 @@ def _order_qcow2_paths_for_boot(paths: list[Path], vm_name: str) -> tuple[list[P
         return paths, primary, 0, analysis
 
     heuristic_primary = _select_primary_disk(paths, vm_name)
+    strategy = _conversion_settings().disk_inspect_strategy
+    sda_paths = [p for p in paths if _is_sda_artifact(p)]
+
+    inspections: list[dict[str, Any]] | None = None
+    if strategy == "never":
+        inspections = [_filename_only_inspection(p) for p in paths]
+    elif strategy != "all" and len(sda_paths) == 1:
+        # virt-inspector takes tens of seconds per disk: confirm the conventional boot
+        # disk first and only inspect the rest if it does not hold an OS.
+        sda_inspection = _inspect_disk_for_system_filesystem(sda_paths[0])
+        if int(sda_inspection.get("score", 0)) > 0:
+            sda_inspection["reason"] = "sda_convention_confirmed"
+            inspections = [sda_inspection if p == sda_paths[0] else _filename_only_inspection(p) for p in paths]
+    if inspections is None:
+        # Inspect the disks concurrently.
+        with ThreadPoolExecutor(max_workers=min(4, len(paths))) as pool:
+            inspections = list(pool.map(_inspect_disk_for_system_filesystem, paths))
+
     inspected: list[dict[str, Any]] = []
-    for idx, p in enumerate(paths):
-        inspect = _inspect_disk_for_system_filesystem(p)
+    for idx, (p, inspect) in enumerate(zip(paths, inspections)):
         filename_score = 0
-        if p.name.endswith("-sda") or p.name.endswith("-sda.qcow2"):
+        if _is_sda_artifact(p):
             filename_score = 10
         elif p == heuristic_primary:
             filename_score = 5
 
-        try:
-            size_bytes = int(p.stat().st_size)
-        except OSError:
-            size_bytes = 0
+        size_bytes = disk_sizes.get(str(p)) if disk_sizes is not None else None
+        if size_bytes is None:
+            try:
+                size_bytes = int(p.stat().st_size)
+            except OSError:
+                size_bytes = 0
 
         total_score = int(inspect.get("score", 0)) + filename_score
         inspected.append(
@@ -425,7 +698,8 @@ def _order_qcow2_paths_for_boot(paths: list[Path], vm_name: str) -> tuple[list[P
 def _execute_workstation_qemu_pipeline(plan: ConversionPlan, vm_name: str) -> dict[str, Any]:
     """Convert workstation-exported disks with qemu-img in strict 1-to-1 mode."""
     start = time.monotonic()
-    target_format = str(getattr(settings, "OPENSTACK_OUTPUT_DISK_FORMAT", "qcow2")).strip().lower() or "qcow2"
+    cfg = _conversion_settings()
+    target_format = cfg.output_disk_format
     if target_format not in {"qcow2", "raw"}:
         raise ConversionExecutionError(
             f"Unsupported OPENSTACK_OUTPUT_DISK_FORMAT='{target_format}'. Allowed: qcow2, raw."
@@ -438,10 +712,9 @@ def _execute_workstation_qemu_pipeline(plan: ConversionPlan, vm_name: str) -> di
     output_dir = Path(plan.output_path).expanduser().parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    conversion_steps: list[dict[str, Any]] = []
-    output_paths: list[Path] = []
+    timeout_seconds = cfg.qemu_img_timeout_seconds
 
-    for idx, source in enumerate(input_disks):
+    def _convert_one(idx: int, source: str) -> tuple[dict[str, Any], Path]:
         src_path = Path(source).expanduser()
         detected = detect_disk_format(src_path)
         if detected not in {"vmdk", "raw", "vhd", "vhdx", "vdi", "qcow2"}:
@@ -452,28 +725,14 @@ def _execute_workstation_qemu_pipeline(plan: ConversionPlan, vm_name: str) -> di
 
         out_name = f"{_sanitize_name(vm_name)}-disk{idx}.{target_format}"
         out_path = output_dir / out_name
+        disk_start = time.monotonic()
         try:
             step = convert_to_openstack_compatible(
                 source_path=src_path,
                 target_path=out_path,
                 source_format=detected,
                 target_format=target_format,
-                timeout_seconds=int(getattr(settings, "QEMU_IMG_TIMEOUT_SECONDS", 3600)),
-            )
-            step["disk_index"] = idx
-            step["status"] = "converted"
-            conversion_steps.append(step)
-            output_paths.append(out_path)
-            logger.info(
-                "migration.disk.converted",
-                extra={
-                    "vm_name": vm_name,
-                    "disk_index": idx,
-                    "source": str(src_path),
-                    "source_format": detected,
-                    "target": str(out_path),
-                    "target_format": target_format,
-                },
+                timeout_seconds=timeout_seconds,
             )
         except DiskConversionError as exc:
             logger.error(
@@ -486,34 +745,54 @@ def _execute_workstation_qemu_pipeline(plan: ConversionPlan, vm_name: str) -> di
                     "error": str(exc),
                 },
             )
-            conversion_steps.append(
-                {
-                    "disk_index": idx,
-                    "source_path": str(src_path),
-                    "source_format": detected,
-                    "target_format": target_format,
-                    "status": "failed",
-                    "error": str(exc),
-                    "stdout": getattr(exc, "stdout", ""),
-                    "stderr": getattr(exc, "stderr", ""),
-                }
-            )
             raise ConversionExecutionError(
-                f"Unsupported or failed disk conversion for '{src_path}' ({detected}): {exc}"
+                f"Unsupported or failed disk conversion for '{src_path}' ({detected}): {exc}",
+                returncode=getattr(exc, "returncode", None),
+                stdout=_truncate_log(getattr(exc, "stdout", "")),
+                stderr=_truncate_log(getattr(exc, "stderr", "")),
             ) from exc
 
+        step["disk_index"] = idx
+        step["status"] = "converted"
+        step["duration_seconds"] = round(time.monotonic() - disk_start, 3)
+        logger.info(
+            "migration.disk.converted",
+            extra={
+                "vm_name": vm_name,
+                "disk_index": idx,
+                "source": str(src_path),
+                "source_format": detected,
+                "target": str(out_path),
+                "target_format": target_format,
+            },
+        )
+        return step, out_path
+
+    # Disks are independent files, so run one qemu-img per disk concurrently (bounded).
+    max_workers = max(1, min(cfg.qemu_img_parallelism, len(input_disks)))
+    results: list[tuple[dict[str, Any], Path] | None] = [None] * len(input_disks)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_convert_one, idx, source): idx for idx, source in enumerate(input_disks)}
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except BaseException:
+            # Fail fast: drop queued disks; conversions already running finish on their own.
+            for pending in futures:
+                pending.cancel()
+            raise
+
+    conversion_steps = [step for step, _ in results]
+    output_paths = [out_path for _, out_path in results]
+
     if len(output_paths) != len(input_disks):
         raise ConversionExecutionError(
             "Disk conversion count mismatch. Disk architecture must remain unchanged "
             f"(source={len(input_disks)}, output={len(output_paths)})."
         )
 
-    disk_sizes: dict[str, int] = {}
-    for p in output_paths:
-        try:
-            disk_sizes[str(p)] = int(p.stat().st_size)
-        except OSError:
-            disk_sizes[str(p)] = 0
+    # qemu-img conversion already sized each output.
+    disk_sizes = {str(out_path): int(step.get("size_bytes") or 0) for step, out_path in results}
 
     duration = round(time.monotonic() - start, 3)
     output_strings = [str(p) for p in output_paths]
@@ -534,54 +813,197 @@ def _execute_workstation_qemu_pipeline(plan: ConversionPlan, vm_name: str) -> di
     }
 
 
-def _execute_virt_v2v(plan: ConversionPlan, vm_name: str) -> dict[str, Any]:
-    start = time.monotonic()
+class _LogTail:
+    """Keep only the last `max_lines` lines (and at most `max_chars` characters) of a child's output stream."""
+
+    def __init__(self, max_lines: int, max_chars: int = 12000) -> None:
+        self.lines: deque[str] = deque()
+        self.max_lines = max(1, max_lines)
+        self.max_chars = max(1, max_chars)
+        self.chars = 0
+        self.dropped = 0
+        # The pump may still be appending when the caller stops waiting for it.
+        self._lock = threading.Lock()
+
+    def append(self, line: str) -> None:
+        if len(line) > self.max_chars:
+            line = line[-self.max_chars:]
+        with self._lock:
+            self.lines.append(line)
+            self.chars += len(line)
+            # Evict from the head so the last lines, where errors are, survive.
+            while len(self.lines) > self.max_lines or self.chars > self.max_chars:
+                self.chars -= len(self.lines.popleft())
+                self.dropped += 1
+
+    def text(self) -> str:
+        with self._lock:
+            body = "".join(self.lines)
+        if self.dropped:
+            return f"...[{self.dropped} earlier lines truncated]\n{body}"
+        return body
+
+
+def _pump_stream(stream, sink: _LogTail) -> None:
+    for line in iter(stream.readline, ""):
+        sink.append(line)
+    stream.close()
+
+
+def _wait_for_exit(proc: subprocess.Popen, timeout_seconds: int) -> int:
+    """Wait for the child to exit, woken by its pidfd on Linux instead of polling waitpid."""
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pidfd = None
+    if pidfd is not None:
+        # poll() rather than select(): long-lived workers can hand out fds >= FD_SETSIZE.
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            ready = poller.poll(timeout_seconds * 1000)
+        finally:
+            os.close(pidfd)
+        if not ready:
+            raise subprocess.TimeoutExpired(proc.args, timeout_seconds)
+    return proc.wait(timeout=timeout_seconds)
+
+
+def _run_supervised(
+    args: list[str],
+    *,
+    env: dict[str, str] | None,
+    timeout_seconds: int,
+    max_log_lines: int = 400,
+    max_log_chars: int = 12000,
+) -> tuple[int, str, str]:
+    """Run a long child process, draining stdout/stderr as it goes.
+
+    Only the last `max_log_lines` lines (up to `max_log_chars` characters) of each
+    stream are kept, so memory stays bounded however chatty the child is. Returns (returncode, stdout, stderr).
+    On timeout the child is killed and subprocess.TimeoutExpired is raised with
+    the output collected so far.
+    """
+    proc = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        env=env,
+    )
+    stdout_lines = _LogTail(max_log_lines, max_log_chars)
+    stderr_lines = _LogTail(max_log_lines, max_log_chars)
+    pumps = [
+        threading.Thread(target=_pump_stream, args=(proc.stdout, stdout_lines), daemon=True),
+        threading.Thread(target=_pump_stream, args=(proc.stderr, stderr_lines), daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+
+    deadline = time.monotonic() + timeout_seconds
+    try:
+        returncode = _wait_for_exit(proc, timeout_seconds)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        for pump in pumps:
+            # Orphaned grandchildren may keep the pipes open; do not hang on them.
+            pump.join(timeout=5)
+        raise subprocess.TimeoutExpired(
+            args,
+            timeout_seconds,
+            output=stdout_lines.text(),
+            stderr=stderr_lines.text(),
+        )
+    except BaseException:
+        # Never leave the child running (and writing into the output dir) behind a failed wait.
+        proc.kill()
+        proc.wait()
+        raise
+
+    for pump in pumps:
+        # A grandchild (eg. nbdkit) may still hold the pipes after the child exits;
+        # keep to the deadline and return what was collected.
+        pump.join(timeout=max(1.0, deadline - time.monotonic()))
+    return returncode, stdout_lines.text(), stderr_lines.text()
+
+
+_VDDK_ENV_KEYS = (
+    "VMWARE_ESXI_CONVERSION_TRANSPORT",
+    "VMWARE_NBDKIT_BIN",
+    "VMWARE_VDDK_NBDKIT_PLUGIN_PATH",
+    "VMWARE_NBDKIT_FILTER_PATH",
+    "VMWARE_VDDK_LIBDIR",
+    "HOME",
+    "PATH",
+    "LD_LIBRARY_PATH",
+)
 
-    run_env = os.environ.copy()
-    # If using VDDK transport, ensure nbdkit can locate the vddk plugin and VDDK libs.
-    transport = os.getenv("VMWARE_ESXI_CONVERSION_TRANSPORT", "").strip().lower()
-    if transport == "vddk":
-        # Ensure virt-v2v finds the intended nbdkit binary (it executes `nbdkit` via PATH).
-        # Prefer explicit binary, otherwise default to ~/.local/bin when present.
-        nbdkit_bin = os.getenv("VMWARE_NBDKIT_BIN", "").strip()
-        nbdkit_dir = None
-        if nbdkit_bin:
-            try:
-                nbdkit_dir = str(Path(nbdkit_bin).expanduser().resolve().parent)
-            except OSError:
-                nbdkit_dir = None
-        else:
-            candidate = Path.home() / ".local" / "bin" / "nbdkit"
-            if candidate.exists():
-                nbdkit_dir = str(candidate.parent)
 
-        if nbdkit_dir:
-            existing_path = run_env.get("PATH", "")
-            run_env["PATH"] = f"{nbdkit_dir}:{existing_path}" if existing_path else nbdkit_dir
+@lru_cache(maxsize=4)
+def _vddk_env_overlay(snapshot: tuple[str, ...]) -> dict[str, str]:
+    """Environment variables virt-v2v needs on top of the worker env for VDDK transport.
 
-        plugin_path = os.getenv("VMWARE_VDDK_NBDKIT_PLUGIN_PATH", "").strip()
-        if plugin_path:
-            run_env["NBDKIT_PLUGIN_PATH"] = plugin_path
+    Keyed on the values of ``_VDDK_ENV_KEYS`` so the nbdkit lookup runs once per configuration.
+    Callers must not mutate the returned dict.
+    """
+    env = dict(zip(_VDDK_ENV_KEYS, snapshot))
+    overlay: dict[str, str] = {}
+    if env["VMWARE_ESXI_CONVERSION_TRANSPORT"].strip().lower() != "vddk":
+        return overlay
+
+    # Ensure virt-v2v finds the intended nbdkit binary (it executes `nbdkit` via PATH).
+    # Prefer explicit binary, otherwise default to ~/.local/bin when present.
+    nbdkit_bin = env["VMWARE_NBDKIT_BIN"].strip()
+    nbdkit_dir = None
+    if nbdkit_bin:
+        try:
+            nbdkit_dir = str(Path(nbdkit_bin).expanduser().resolve().parent)
+        except OSError:
+            nbdkit_dir = None
+    else:
+        candidate = Path.home() / ".local" / "bin" / "nbdkit"
+        if candidate.exists():
+            nbdkit_dir = str(candidate.parent)
+
+    if nbdkit_dir:
+        existing_path = env["PATH"]
+        overlay["PATH"] = f"{nbdkit_dir}:{existing_path}" if existing_path else nbdkit_dir
 
-        # virt-v2v uses nbdkit filters like "cow". Ensure nbdkit can find them.
-        filter_path = os.getenv("VMWARE_NBDKIT_FILTER_PATH", "").strip()
-        if filter_path:
-            run_env["NBDKIT_FILTER_PATH"] = filter_path
+    plugin_path = env["VMWARE_VDDK_NBDKIT_PLUGIN_PATH"].strip()
+    if plugin_path:
+        overlay["NBDKIT_PLUGIN_PATH"] = plugin_path
 
-        vddk_libdir = os.getenv("VMWARE_VDDK_LIBDIR", "").strip()
-        if vddk_libdir:
-            lib64 = str(Path(vddk_libdir).expanduser() / "lib64")
-            existing = run_env.get("LD_LIBRARY_PATH", "")
-            run_env["LD_LIBRARY_PATH"] = f"{lib64}:{existing}" if existing else lib64
+    # virt-v2v uses nbdkit filters like "cow". Ensure nbdkit can find them.
+    filter_path = env["VMWARE_NBDKIT_FILTER_PATH"].strip()
+    if filter_path:
+        overlay["NBDKIT_FILTER_PATH"] = filter_path
+
+    vddk_libdir = env["VMWARE_VDDK_LIBDIR"].strip()
+    if vddk_libdir:
+        lib64 = str(Path(vddk_libdir).expanduser() / "lib64")
+        existing = env["LD_LIBRARY_PATH"]
+        overlay["LD_LIBRARY_PATH"] = f"{lib64}:{existing}" if existing else lib64
+    return overlay
+
+
+def _execute_virt_v2v(plan: ConversionPlan, vm_name: str) -> dict[str, Any]:
+    start = time.monotonic()
+
+    cfg = _conversion_settings()
+    overlay = _vddk_env_overlay(tuple(os.environ.get(key, "") for key in _VDDK_ENV_KEYS))
+    # No overlay: let the child inherit the worker environment without copying it.
+    run_env = {**os.environ, **overlay} if overlay else None
 
     try:
-        completed = subprocess.run(
+        returncode, stdout, stderr = _run_supervised(
             plan.command_args,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=int(getattr(settings, "VIRT_V2V_TIMEOUT_SECONDS", 7200)),
             env=run_env,
+            timeout_seconds=cfg.virt_v2v_timeout_seconds,
+            max_log_lines=cfg.virt_v2v_log_tail_lines,
         )
     except PermissionError as exc:
         raise ConversionExecutionError(f"Permission error executing virt-v2v: {exc}") from exc
@@ -589,7 +1011,7 @@ def _execute_virt_v2v(plan: ConversionPlan, vm_name: str) -> dict[str, Any]:
         raise ConversionExecutionError("virt-v2v command not found. Is virt-v2v installed?") from exc
     except subprocess.TimeoutExpired as exc:
         raise ConversionExecutionError(
-            f"virt-v2v timed out after {getattr(settings, 'VIRT_V2V_TIMEOUT_SECONDS', 7200)}s",
+            f"virt-v2v timed out after {cfg.virt_v2v_timeout_seconds}s",
             stdout=exc.stdout or "",
             stderr=exc.stderr or "",
         ) from exc
@@ -597,36 +1019,30 @@ def _execute_virt_v2v(plan: ConversionPlan, vm_name: str) -> dict[str, Any]:
         raise ConversionExecutionError(f"OS error executing virt-v2v: {exc}") from exc
 
     duration = round(time.monotonic() - start, 3)
-    stdout = completed.stdout or ""
-    stderr = completed.stderr or ""
 
-    if completed.returncode != 0:
+    if returncode != 0:
         raise ConversionExecutionError(
-            f"virt-v2v failed with exit code {completed.returncode}",
-            returncode=completed.returncode,
+            f"virt-v2v failed with exit code {returncode}",
+            returncode=returncode,
             stdout=stdout,
             stderr=stderr,
         )
 
     try:
-        qcow2_paths = _find_output_qcow2_paths(plan.output_path, vm_name)
-        qcow2_paths, primary_qcow2_path, primary_disk_index, disk_analysis = _order_qcow2_paths_for_boot(qcow2_paths, vm_name)
+        found = _find_output_qcow2_paths(plan.output_path, vm_name)
+        disk_sizes = {str(p): size_bytes for p, size_bytes in found}
+        qcow2_paths, primary_qcow2_path, primary_disk_index, disk_analysis = _order_qcow2_paths_for_boot(
+            [p for p, _ in found], vm_name, disk_sizes
+        )
     except ConversionExecutionError as exc:
         # Preserve virt-v2v logs even when artifact detection fails.
         raise ConversionExecutionError(str(exc), stdout=stdout, stderr=stderr) from exc
 
-    disk_sizes: dict[str, int] = {}
-    for p in qcow2_paths:
-        try:
-            disk_sizes[str(p)] = int(p.stat().st_size)
-        except OSError:
-            disk_sizes[str(p)] = 0
-
     return {
-        "returncode": completed.returncode,
+        "returncode": returncode,
         "duration_seconds": duration,
-        "stdout": _truncate_log(stdout),
-        "stderr": _truncate_log(stderr),
+        "stdout": stdout,
+        "stderr": stderr,
         "output_qcow2_path": str(primary_qcow2_path),
         "output_qcow2_paths": [str(p) for p in qcow2_paths],
         "primary_disk_index": primary_disk_index,
@@ -662,8 +1078,11 @@ def _execute_ansible_conversion(plan: ConversionPlan, vm_name: str) -> dict[str,
         )
 
     try:
-        qcow2_paths = _find_output_qcow2_paths(plan.output_path, vm_name)
-        qcow2_paths, primary_qcow2_path, primary_disk_index, disk_analysis = _order_qcow2_paths_for_boot(qcow2_paths, vm_name)
+        found = _find_output_qcow2_paths(plan.output_path, vm_name)
+        disk_sizes = {str(p): size_bytes for p, size_bytes in found}
+        qcow2_paths, primary_qcow2_path, primary_disk_index, disk_analysis = _order_qcow2_paths_for_boot(
+            [p for p, _ in found], vm_name, disk_sizes
+        )
     except ConversionExecutionError as exc:
         raise ConversionExecutionError(
             f"Ansible conversion completed but artifacts are unavailable: {exc}",
@@ -671,18 +1090,12 @@ def _execute_ansible_conversion(plan: ConversionPlan, vm_name: str) -> dict[str,
             stderr=result.get("stderr", ""),
         ) from exc
 
-    disk_sizes: dict[str, int] = {}
-    for p in qcow2_paths:
-        try:
-            disk_sizes[str(p)] = int(p.stat().st_size)
-        except OSError:
-            disk_sizes[str(p)] = 0
-
     return {
         "returncode": result.get("returncode", 0),
         "duration_seconds": result.get("duration_seconds", 0),
-        "stdout": _truncate_log(result.get("stdout", "")),
-        "stderr": _truncate_log(result.get("stderr", "")),
+        # The runner already keeps only a bounded tail of each stream.
+        "stdout": result.get("stdout", ""),
+        "stderr": result.get("stderr", ""),
         "output_qcow2_path": str(primary_qcow2_path),
         "output_qcow2_paths": [str(p) for p in qcow2_paths],
         "primary_disk_index": primary_disk_index,
@@ -696,12 +1109,12 @@ def _execute_ansible_conversion(plan: ConversionPlan, vm_name: str) -> dict[str,
 
 
 def _mark_job_failed(job: MigrationJob, error_message: str) -> None:
-    metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
+    metadata = _safe_meta(job)
     metadata["last_error"] = error_message
     job.conversion_metadata = metadata
 
     if job.status != MigrationJob.Status.FAILED and job.can_transition_to(MigrationJob.Status.FAILED):
-        job.transition(MigrationJob.Status.FAILED)
+        job.transition(MigrationJob.Status.FAILED, save=False)
     else:
         job.status = MigrationJob.Status.FAILED
 
@@ -709,7 +1122,7 @@ def _mark_job_failed(job: MigrationJob, error_message: str) -> None:
 
 
 def _schedule_rollback(job: MigrationJob, reason: str, extra_context: dict[str, Any] | None = None) -> None:
-    if not getattr(settings, "ENABLE_ROLLBACK", True):
+    if not _conversion_settings().enable_rollback:
         logger.info(
             "migration.rollback disabled",
             extra={"job_id": job.id, "vm_name": job.vm_name, "reason": reason},
@@ -720,78 +1133,175 @@ def _schedule_rollback(job: MigrationJob, reason: str, extra_context: dict[str,
     if extra_context:
         context.update(extra_context)
 
-    rollback_migration.delay(job.id, context=context)
+    # Publish only once the FAILED status is committed, so the rollback worker never reads
+    # the pre-failure row. Outside a transaction this runs immediately.
+    job_id = job.id
+    transaction.on_commit(lambda: rollback_migration.delay(job_id, context=context))
+
+
+# copy_file_range errors meaning "not possible here" (old kernel, cross-device, unsupported fs).
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EPERM}
+)
+
+
+def _copy_times(src: Path, dst: Path) -> None:
+    # Backups only need timestamps; copystat would also probe xattrs/ACLs and chmod.
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fastcopy(src: Path, dst: Path) -> str:
+    """Copy ``src`` to ``dst`` keeping its timestamps; returns the method used.
+
+    Tries ``os.copy_file_range`` first, which reflinks on Btrfs/XFS and copies server-side on
+    NFS, then falls back to ``shutil.copyfile`` (in-kernel ``sendfile`` on Linux).
+    """
+    method = "copyfile"
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            copied = 0
+            try:
+                while remaining > 0:
+                    # Capped per call: some kernels reject counts above 2 GiB.
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(remaining, 1 << 30))
+                    if sent == 0:
+                        break
+                    copied += sent
+                    remaining -= sent
+            except OSError as exc:
+                if copied or exc.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                    raise
+            else:
+                method = "copy_file_range"
+    if method != "copy_file_range":
+        shutil.copyfile(src, dst)
+    _copy_times(src, dst)
+    return method
+
+
+def _backup_is_current(src: Path, dst: Path) -> bool:
+    """True when ``dst`` is a complete backup of ``src`` (a retried task can skip the copy)."""
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    src_st = os.stat(src)
+    # Every method stamps the source mtime on the backup only once it is complete (a hardlink
+    # shares it); a copy cut short by a lost worker keeps its write time. Sizes are not compared:
+    # a qemu-img convert backup rarely matches the source byte for byte.
+    return dst_st.st_mtime_ns == src_st.st_mtime_ns
+
+
+def _backup_artifact(src: Path, dst: Path, *, use_qemu_img: bool, allow_hardlink: bool = False) -> str:
+    """Back up one converted disk; returns the method used."""
+    if allow_hardlink:
+        # Zero I/O when both directories share a filesystem; the output is only read after this point.
+        # The inode is shared, so this only protects against deletion of the output, not against
+        # a later in-place rewrite (see ARTIFACT_BACKUP_ALLOW_HARDLINK).
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass  # Cross-device, unsupported or link limit: copy instead.
+    if use_qemu_img:
+        try:
+            disk_format = detect_disk_format(src)
+            if disk_format in {"qcow2", "raw"}:
+                # Same format in and out; only allocated clusters are read and written.
+                convert_with_qemu_img(
+                    source_path=src,
+                    target_path=dst,
+                    source_format=disk_format,
+                    target_format=disk_format,
+                    timeout_seconds=_conversion_settings().qemu_img_timeout_seconds,
+                )
+                _copy_times(src, dst)
+                return "qemu-img-convert"
+        except (DiskConversionError, DiskFormatError) as exc:
+            logger.warning(
+                "migration.backup qemu_img_failed",
+                extra={"source_path": str(src), "error": str(exc)},
+            )
+    return _fastcopy(src, dst)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, preferring native ``rm -rf`` over Python-level ``shutil.rmtree``."""
+    rm_bin = _which("rm") if os.name == "posix" else None
+    if rm_bin:
+        try:
+            completed = subprocess.run(
+                [rm_bin, "-rf", "--", str(path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError):
+            completed = None
+        if completed is not None and completed.returncode == 0:
+            return
+    # Also removes whatever rm left behind (e.g. it failed part-way).
+    shutil.rmtree(path, ignore_errors=True)
 
 
 def _collect_cleanup_targets(job: MigrationJob, context: dict[str, Any] | None) -> tuple[list[Path], list[Path]]:
     context = context or {}
-    metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-    conversion = metadata.get("conversion", {}) if isinstance(metadata.get("conversion"), dict) else {}
-    execution = conversion.get("execution", {}) if isinstance(conversion.get("execution"), dict) else {}
-
-    file_candidates: list[str] = []
-    dir_candidates: list[str] = []
+    metadata = _safe_meta(job)
+    conversion = _dict_or(metadata, "conversion")
+    execution = _dict_or(conversion, "execution")
+
+    def _normalized(candidates: Any) -> list[str]:
+        if not isinstance(candidates, list):
+            return []
+        return [
+            str(Path(candidate.strip()).expanduser())
+            for candidate in candidates
+            if isinstance(candidate, str) and candidate.strip()
+        ]
 
     # Never delete backup artifacts during rollback.
-    exclude_files = set()
-    if isinstance(conversion.get("backup"), dict):
-        backup_path = conversion["backup"].get("path")
-        if isinstance(backup_path, str) and backup_path.strip():
-            exclude_files.add(str(Path(backup_path).expanduser()))
-        backup_paths = conversion["backup"].get("paths")
-        if isinstance(backup_paths, list):
-            for backup_item in backup_paths:
-                if isinstance(backup_item, str) and backup_item.strip():
-                    exclude_files.add(str(Path(backup_item).expanduser()))
-
-    for candidate in [
-        execution.get("output_qcow2_path"),
-        conversion.get("output_path"),
-        context.get("output_qcow2_path"),
-    ]:
-        if isinstance(candidate, str) and candidate.strip():
-            p = str(Path(candidate.strip()).expanduser())
-            if p not in exclude_files:
-                file_candidates.append(candidate.strip())
-
-    if isinstance(execution.get("output_qcow2_paths"), list):
-        for candidate in execution.get("output_qcow2_paths", []):
-            if isinstance(candidate, str) and candidate.strip():
-                p = str(Path(candidate.strip()).expanduser())
-                if p not in exclude_files:
-                    file_candidates.append(candidate.strip())
-
-    for candidate in context.get("temp_dirs", []):
-        if isinstance(candidate, str) and candidate.strip():
-            dir_candidates.append(candidate.strip())
-
-    if isinstance(conversion.get("temp_dirs"), list):
-        for candidate in conversion.get("temp_dirs", []):
-            if isinstance(candidate, str) and candidate.strip():
-                dir_candidates.append(candidate.strip())
-
-    files: list[Path] = []
-    seen_files = set()
-    for candidate in file_candidates:
-        p = Path(candidate).expanduser()
-        if str(p) not in seen_files:
-            files.append(p)
-            seen_files.add(str(p))
-
-    dirs: list[Path] = []
-    seen_dirs = set()
-    for candidate in dir_candidates:
-        p = Path(candidate).expanduser()
-        if str(p) not in seen_dirs:
-            dirs.append(p)
-            seen_dirs.add(str(p))
+    exclude_files: set[str] = set()
+    backup = conversion.get("backup")
+    if isinstance(backup, dict):
+        exclude_files.update(_normalized([backup.get("path")]))
+        exclude_files.update(_normalized(backup.get("paths")))
+
+    # Each candidate is normalized once; dict.fromkeys dedupes while keeping order.
+    file_candidates = _normalized(
+        [execution.get("output_qcow2_path"), conversion.get("output_path"), context.get("output_qcow2_path")]
+    ) + _normalized(execution.get("output_qcow2_paths"))
+    dir_candidates = _normalized(context.get("temp_dirs")) + _normalized(conversion.get("temp_dirs"))
+
+    files = [Path(p) for p in dict.fromkeys(file_candidates) if p not in exclude_files]
+    dirs = [Path(p) for p in dict.fromkeys(dir_candidates)]
 
     return files, dirs
 
 
+def _rollback_local_artifacts(files: list[Path], dirs: list[Path], actions: list[dict[str, Any]]) -> None:
+    for path in files:
+        # unlink() reports absence itself; no stat beforehand.
+        try:
+            os.unlink(path)
+        except (FileNotFoundError, IsADirectoryError):
+            actions.append({"action": "delete_file", "path": str(path), "status": "not_found"})
+        else:
+            actions.append({"action": "delete_file", "path": str(path), "status": "deleted"})
+
+    for path in dirs:
+        # is_dir() is a single stat and is False for missing paths.
+        if path.is_dir():
+            _fast_rmtree(path)
+            actions.append({"action": "delete_dir", "path": str(path), "status": "deleted"})
+        else:
+            actions.append({"action": "delete_dir", "path": str(path), "status": "not_found"})
+
+
 def _rollback_openstack_resources(job: MigrationJob, actions: list[dict[str, Any]]) -> None:
-    metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-    os_meta = metadata.get("openstack", {}) if isinstance(metadata.get("openstack"), dict) else {}
+    metadata = _safe_meta(job)
+    os_meta = _dict_or(metadata, "openstack")
 
     server_id = os_meta.get("server_id")
     image_ids: list[str] = []
@@ -821,49 +1331,37 @@ def _rollback_openstack_resources(job: MigrationJob, actions: list[dict[str, Any
                 id=selected_openstack_endpoint_session_id
             ).first()
             auth_overrides = openstack_session.to_connect_kwargs() if openstack_session else None
-        conn = connect_openstack(cloud=cloud, auth_overrides=auth_overrides)
+        conn = get_openstack_connection(cloud=cloud, auth_overrides=auth_overrides)
     except OpenStackDeploymentError as exc:
         actions.append({"action": "openstack_cleanup", "status": "error", "error": str(exc)})
         return
 
-    if server_id:
-        try:
-            status = delete_server_if_exists(conn, server_id)
-            actions.append({"action": "delete_server", "server_id": server_id, "status": status})
-        except Exception as exc:
-            actions.append({
-                "action": "delete_server",
-                "server_id": server_id,
-                "status": "error",
-                "error": str(exc),
-            })
-
-    for volume_id in volume_ids:
-        try:
-            status = delete_volume_if_exists(conn, volume_id)
-            actions.append({"action": "delete_volume", "volume_id": volume_id, "status": status})
-        except Exception as exc:
-            actions.append({
-                "action": "delete_volume",
-                "volume_id": volume_id,
-                "status": "error",
-                "error": str(exc),
-            })
+    # Volumes and images are deleted concurrently once the server is gone.
+    results = cleanup_resources(
+        conn,
+        server_ids=[server_id] if server_id else [],
+        volume_ids=volume_ids,
+        image_ids=image_ids,
+    )
+    for kind, action, key in (
+        ("servers", "delete_server", "server_id"),
+        ("volumes", "delete_volume", "volume_id"),
+        ("images", "delete_image", "image_id"),
+    ):
+        for resource_id, status in results[kind].items():
+            if status.startswith("error: "):
+                actions.append({"action": action, key: resource_id, "status": "error", "error": status[7:]})
+            else:
+                actions.append({"action": action, key: resource_id, "status": status})
 
-    for image_id in image_ids:
-        try:
-            status = delete_image_if_exists(conn, image_id)
-            actions.append({"action": "delete_image", "image_id": image_id, "status": status})
-        except Exception as exc:
-            actions.append({
-                "action": "delete_image",
-                "image_id": image_id,
-                "status": "error",
-                "error": str(exc),
-            })
-
-
-@shared_task(name="migrations.rollback_migration", max_retries=1, default_retry_delay=30, acks_late=True)
+
+@shared_task(
+    name="migrations.rollback_migration",
+    max_retries=1,
+    default_retry_delay=30,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
 def rollback_migration(job_id: int, context: dict[str, Any] | None = None) -> dict[str, Any]:
     """Rollback conversion artifacts for failed jobs and mark them ROLLED_BACK."""
 
@@ -879,30 +1377,27 @@ def rollback_migration(job_id: int, context: dict[str, Any] | None = None) -> di
     try:
         files, dirs = _collect_cleanup_targets(job, context)
 
-        for path in files:
-            if path.exists() and path.is_file():
-                path.unlink()
-                actions.append({"action": "delete_file", "path": str(path), "status": "deleted"})
-            else:
-                actions.append({"action": "delete_file", "path": str(path), "status": "not_found"})
-
-        for path in dirs:
-            if path.exists() and path.is_dir():
-                shutil.rmtree(path, ignore_errors=True)
-                actions.append({"action": "delete_dir", "path": str(path), "status": "deleted"})
-            else:
-                actions.append({"action": "delete_dir", "path": str(path), "status": "not_found"})
-
-        _rollback_openstack_resources(job, actions)
-
-        metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
+        # Local artifacts and OpenStack resources are independent: delete the files on a
+        # helper thread (no DB access there) while this thread talks to OpenStack.
+        local_actions: list[dict[str, Any]] = []
+        openstack_actions: list[dict[str, Any]] = []
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                local_cleanup = pool.submit(_rollback_local_artifacts, files, dirs, local_actions)
+                _rollback_openstack_resources(job, openstack_actions)
+                local_cleanup.result()
+        finally:
+            actions.extend(local_actions)
+            actions.extend(openstack_actions)
+
+        metadata = _safe_meta(job)
         metadata["rollback_at"] = timezone.now().isoformat()
         metadata["rollback_reason"] = rollback_reason
         metadata["rollback_actions"] = actions
         job.conversion_metadata = metadata
 
         if job.status == MigrationJob.Status.FAILED and job.can_transition_to(MigrationJob.Status.ROLLED_BACK):
-            job.transition(MigrationJob.Status.ROLLED_BACK)
+            job.transition(MigrationJob.Status.ROLLED_BACK, save=False)
         elif job.status == MigrationJob.Status.ROLLED_BACK:
             pass
         else:
@@ -957,9 +1452,23 @@ def _build_base_conversion_metadata(
     }
 
 
+def _as_nonempty_str(value: Any) -> str | None:
+    """Stripped string, or None for non-strings and blanks."""
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+def _as_positive_int(value: Any) -> int | None:
+    # bool is an int subclass; True must not become a 1-vCPU override.
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
 def _effective_target_spec(job: MigrationJob, discovered_vm: DiscoveredVM) -> dict[str, Any]:
-    metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-    requested = metadata.get("requested_spec", {}) if isinstance(metadata.get("requested_spec"), dict) else {}
+    metadata = _safe_meta(job)
+    requested = _dict_or(metadata, "requested_spec")
     disk_layout_mode = str(requested.get("disk_layout_mode", "") or "").strip().lower()
     disk_merge = bool(requested.get("disk_merge", False))
     if disk_merge or disk_layout_mode in {"merge", "concat", "concatenate"}:
@@ -968,39 +1477,19 @@ def _effective_target_spec(job: MigrationJob, discovered_vm: DiscoveredVM) -> di
             "Disk architecture must remain unchanged (1-to-1, same order, no merge)."
         )
 
-    flavor_id = requested.get("flavor_id") if isinstance(requested.get("flavor_id"), str) else None
-    if isinstance(flavor_id, str) and not flavor_id.strip():
-        flavor_id = None
-    if isinstance(flavor_id, str):
-        flavor_id = flavor_id.strip()
+    flavor_id = _as_nonempty_str(requested.get("flavor_id"))
+    target_cpu = _as_positive_int(requested.get("cpu")) or discovered_vm.cpu
+    target_ram = _as_positive_int(requested.get("ram")) or discovered_vm.ram
 
-    target_cpu = requested.get("cpu") if isinstance(requested.get("cpu"), int) and requested.get("cpu") > 0 else discovered_vm.cpu
-    target_ram = requested.get("ram") if isinstance(requested.get("ram"), int) and requested.get("ram") > 0 else discovered_vm.ram
-
-    network_overrides = requested.get("network", {}) if isinstance(requested.get("network"), dict) else {}
-    network_id = network_overrides.get("network_id")
-    network_name = network_overrides.get("network_name")
-    fixed_ip = network_overrides.get("fixed_ip")
-
-    if not isinstance(network_id, str) or not network_id.strip():
-        network_id = None
-    else:
-        network_id = network_id.strip()
-
-    if not isinstance(network_name, str) or not network_name.strip():
-        network_name = None
-    else:
-        network_name = network_name.strip()
-
-    if not isinstance(fixed_ip, str) or not fixed_ip.strip():
-        fixed_ip = None
-    else:
-        fixed_ip = fixed_ip.strip()
+    network_overrides = _dict_or(requested, "network")
+    network_id = _as_nonempty_str(network_overrides.get("network_id"))
+    network_name = _as_nonempty_str(network_overrides.get("network_name"))
+    fixed_ip = _as_nonempty_str(network_overrides.get("fixed_ip"))
 
     raw_extra_disks = requested.get("extra_disks_gb")
     extra_disks_gb: list[int] = []
     if isinstance(raw_extra_disks, list):
-        extra_disks_gb = [int(v) for v in raw_extra_disks if isinstance(v, int) and v > 0]
+        extra_disks_gb = [v for v in raw_extra_disks if _as_positive_int(v)]
 
     return {
         "flavor_id": flavor_id,
@@ -1013,6 +1502,46 @@ def _effective_target_spec(job: MigrationJob, discovered_vm: DiscoveredVM) -> di
     }
 
 
+_DEPLOY_PICK_CACHE_SECONDS = 30
+
+
+def _resolve_flavor_and_network(conn, scope: str, target_spec: dict[str, Any]) -> tuple[FlavorChoice, Any]:
+    """Pick the flavor and network for a deployment, reusing recent picks for the same cloud.
+
+    The flavor catalog and network list change rarely, so concurrent or back-to-back
+    deployments against one endpoint skip those listings for up to 30 seconds (less when
+    OPENSTACK_LISTING_CACHE_SECONDS is lower). Lookups that raise are not cached.
+    """
+    flavor_id = target_spec.get("flavor_id")
+    flavor_part = f"id={flavor_id}" if flavor_id else f"spec={target_spec['cpu']}x{target_spec['ram']}"
+    preferred_id = target_spec.get("network_id")
+    preferred_name = target_spec["network_name"] or getattr(settings, "OPENSTACK_DEFAULT_NETWORK", "") or None
+    flavor_key = f"openstack:deploy-flavor:{scope}:{flavor_part}"
+    network_key = f"openstack:deploy-network:{scope}:{preferred_id or ''}:{preferred_name or ''}"
+    cached = cache.get_many([flavor_key, network_key])
+    fresh: dict[str, Any] = {}
+
+    flavor = cached.get(flavor_key)
+    if flavor is None:
+        if flavor_id:
+            flavor = get_flavor_choice_by_id(conn, flavor_id)
+        else:
+            flavor = map_vmware_to_flavor(conn, target_spec["cpu"], target_spec["ram"])
+        fresh[flavor_key] = flavor
+
+    network = cached.get(network_key)
+    if network is None:
+        resource = select_default_network(conn, preferred_name=preferred_name, preferred_id=preferred_id)
+        # Only id/name are used downstream; keep the cached value a plain, picklable object.
+        network = SimpleNamespace(id=resource.id, name=resource.name)
+        fresh[network_key] = network
+
+    if fresh:
+        # Picks feed a server boot, so keep them shorter-lived than the validation listings.
+        cache.set_many(fresh, timeout=min(_DEPLOY_PICK_CACHE_SECONDS, settings.OPENSTACK_LISTING_CACHE_SECONDS))
+    return flavor, network
+
+
 def _validate_openstack_disk_attachments(conn, server_id: str, expected_volume_ids: list[str]) -> dict[str, Any]:
     server = conn.compute.get_server(server_id)
     attached = getattr(server, "attached_volumes", None) or []
@@ -1022,18 +1551,23 @@ def _validate_openstack_disk_attachments(conn, server_id: str, expected_volume_i
         if isinstance(item, dict) and isinstance(item.get("id"), str)
     }
 
-    missing = [vid for vid in expected_volume_ids if vid not in attached_ids]
+    # Cinder has no reliable multi-id filter, so issue the per-volume GETs concurrently.
+    volumes: list[Any] = []
+    if expected_volume_ids:
+        with ThreadPoolExecutor(max_workers=min(8, len(expected_volume_ids))) as pool:
+            volumes = list(pool.map(conn.block_storage.get_volume, expected_volume_ids))
     per_volume: list[dict[str, Any]] = []
-    for volume_id in expected_volume_ids:
-        volume = conn.block_storage.get_volume(volume_id)
+    # Single pass in disk order; dict keys dedupe ids failing both checks.
+    missing: dict[str, None] = {}
+    for volume_id, volume in zip(expected_volume_ids, volumes):
         status = str(getattr(volume, "status", "")).lower()
         per_volume.append({"volume_id": volume_id, "status": status})
-        if status not in {"in-use", "in_use"}:
-            missing.append(volume_id)
+        if volume_id not in attached_ids or status not in {"in-use", "in_use"}:
+            missing[volume_id] = None
 
     return {
-        "ok": len(missing) == 0,
-        "missing_or_not_in_use": sorted(set(missing)),
+        "ok": not missing,
+        "missing_or_not_in_use": list(missing),
         "attached_volume_ids": sorted(attached_ids),
         "volumes": per_volume,
         "note": (
@@ -1043,10 +1577,27 @@ def _validate_openstack_disk_attachments(conn, server_id: str, expected_volume_i
     }
 
 
+def _known_attachment_validation(volume_ids: list[str]) -> dict[str, Any]:
+    """Validation result for volumes this run already saw attached, without re-querying OpenStack."""
+    return {
+        "ok": True,
+        "missing_or_not_in_use": [],
+        "attached_volume_ids": sorted(volume_ids),
+        "volumes": [{"volume_id": volume_id, "status": "in-use"} for volume_id in volume_ids],
+        "note": "Derived from attach responses: every volume was the boot volume or already attached.",
+    }
+
+
+def _attachments_known(attached_volumes: list[dict[str, Any]]) -> bool:
+    # A fresh "attached" only means Nova accepted the request (it completes asynchronously),
+    # so only the boot volume and volumes Nova already listed on the server count.
+    return all(entry.get("status") in {"boot_volume", "already_attached"} for entry in attached_volumes)
+
+
 def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) -> dict[str, Any]:
-    metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-    conversion = metadata.get("conversion", {}) if isinstance(metadata.get("conversion"), dict) else {}
-    execution = conversion.get("execution", {}) if isinstance(conversion.get("execution"), dict) else {}
+    metadata = _safe_meta(job)
+    conversion = _dict_or(metadata, "conversion")
+    execution = _dict_or(conversion, "execution")
 
     qcow2_paths_raw = execution.get("output_qcow2_paths")
     qcow2_paths: list[str] = []
@@ -1066,36 +1617,59 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             f"Unsupported converted disk format '{output_disk_format}'. Allowed: qcow2, raw."
         )
 
+    # Read once: the per-disk calls below all use the same values.
+    retries = int(getattr(settings, "OPENSTACK_API_RETRIES", 2))
+    retry_delay = int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3))
+    upload_timeout = int(getattr(settings, "OPENSTACK_IMAGE_UPLOAD_TIMEOUT", 900))
+    upload_poll_interval = int(getattr(settings, "OPENSTACK_IMAGE_UPLOAD_POLL_INTERVAL", 5))
+    verify_timeout = int(getattr(settings, "OPENSTACK_VERIFY_TIMEOUT", 900))
+    verify_poll_interval = int(getattr(settings, "OPENSTACK_VERIFY_POLL_INTERVAL", 10))
+
     selected_openstack_endpoint_session_id = metadata.get("selected_openstack_endpoint_session_id")
     cloud = getattr(settings, "OPENSTACK_CLOUD_NAME", "openstack")
     auth_overrides = None
     if isinstance(selected_openstack_endpoint_session_id, int):
         openstack_session = OpenstackEndpointSession.objects.filter(id=selected_openstack_endpoint_session_id).first()
         auth_overrides = openstack_session.to_connect_kwargs() if openstack_session else None
-    conn = connect_openstack(cloud=cloud, auth_overrides=auth_overrides)
+    conn = get_openstack_connection(cloud=cloud, auth_overrides=auth_overrides)
 
-    os_meta = metadata.get("openstack", {}) if isinstance(metadata.get("openstack"), dict) else {}
+    os_meta = _dict_or(metadata, "openstack")
     if isinstance(selected_openstack_endpoint_session_id, int):
         os_meta["selected_openstack_endpoint_session_id"] = selected_openstack_endpoint_session_id
+
+    if _openstack_deployment_recorded(os_meta, len(qcow2_paths)):
+        # A previous run got as far as attaching every volume (it was lost while
+        # verifying); re-checking each image/volume/server would be pure round trips.
+        return _verify_openstack_deployment(
+            job,
+            conn,
+            metadata,
+            os_meta,
+            verify_timeout=verify_timeout,
+            verify_poll_interval=verify_poll_interval,
+        )
+
     names = build_openstack_names(job.vm_name, job.id)
+    image_base = names["image_name"]
+    server_base = names["server_name"]
+    # The first disk keeps the bare name (as single-disk jobs always have); uploads and the
+    # recorded metadata share this one list so the two can never disagree.
+    image_names = [image_base if idx == 0 else f"{image_base}-disk{idx}" for idx in range(len(qcow2_paths))]
     target_spec = _effective_target_spec(job, discovered_vm)
 
-    if target_spec.get("flavor_id"):
-        flavor = get_flavor_choice_by_id(conn, target_spec["flavor_id"])
-    else:
-        flavor = map_vmware_to_flavor(conn, target_spec["cpu"], target_spec["ram"])
-
-    preferred_network = target_spec["network_name"] or getattr(settings, "OPENSTACK_DEFAULT_NETWORK", "") or None
-    network = select_default_network(
-        conn,
-        preferred_name=preferred_network,
-        preferred_id=target_spec.get("network_id"),
+    cache_scope = (
+        f"session-{selected_openstack_endpoint_session_id}"
+        if isinstance(selected_openstack_endpoint_session_id, int)
+        else f"cloud-{cloud}"
     )
+    flavor, network = _resolve_flavor_and_network(conn, cache_scope, target_spec)
 
     existing_image_ids = os_meta.get("image_ids") if isinstance(os_meta.get("image_ids"), list) else []
-    image_ids: list[str] = []
-    for idx, qcow2_path in enumerate(qcow2_paths):
-        image_name = names["image_name"] if idx == 0 else f"{names['image_name']}-disk{idx}"
+    existing_volume_ids = os_meta.get("volume_ids") if isinstance(os_meta.get("volume_ids"), list) else []
+    attached_volumes: list[dict[str, Any]] = []
+
+    def _deploy_disk(idx: int, qcow2_path: str) -> tuple[str, str]:
+        image_name = image_names[idx]
         existing_image_id = None
         if idx < len(existing_image_ids) and isinstance(existing_image_ids[idx], str):
             existing_image_id = existing_image_ids[idx]
@@ -1108,18 +1682,13 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             image_name=image_name,
             disk_format=output_disk_format,
             existing_image_id=existing_image_id,
-            timeout_seconds=int(getattr(settings, "OPENSTACK_IMAGE_UPLOAD_TIMEOUT", 900)),
-            poll_interval_seconds=int(getattr(settings, "OPENSTACK_IMAGE_UPLOAD_POLL_INTERVAL", 5)),
-            retries=int(getattr(settings, "OPENSTACK_API_RETRIES", 2)),
-            retry_delay_seconds=int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3)),
+            timeout_seconds=upload_timeout,
+            poll_interval_seconds=upload_poll_interval,
+            retries=retries,
+            retry_delay_seconds=retry_delay,
         )
-        image_ids.append(image_id)
 
-    existing_volume_ids = os_meta.get("volume_ids") if isinstance(os_meta.get("volume_ids"), list) else []
-    attached_volumes: list[dict[str, Any]] = []
-    converted_volume_ids: list[str] = []
-    for idx, image_id in enumerate(image_ids):
-        vol_name = f"{names['server_name']}-disk{idx}"
+        vol_name = f"{server_base}-disk{idx}"
         existing_volume_id = None
         if idx < len(existing_volume_ids) and isinstance(existing_volume_ids[idx], str):
             existing_volume_id = existing_volume_ids[idx]
@@ -1128,12 +1697,34 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             volume_name=vol_name,
             image_id=image_id,
             existing_volume_id=existing_volume_id,
-            timeout_seconds=int(getattr(settings, "OPENSTACK_VERIFY_TIMEOUT", 900)),
-            poll_interval_seconds=int(getattr(settings, "OPENSTACK_IMAGE_UPLOAD_POLL_INTERVAL", 5)),
-            retries=int(getattr(settings, "OPENSTACK_API_RETRIES", 2)),
-            retry_delay_seconds=int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3)),
+            timeout_seconds=verify_timeout,
+            poll_interval_seconds=upload_poll_interval,
+            retries=retries,
+            retry_delay_seconds=retry_delay,
         )
-        converted_volume_ids.append(volume_id)
+        return image_id, volume_id
+
+    # Each disk's upload -> volume chain is independent and mostly waits on Glance/Cinder,
+    # so run the chains concurrently. The connection's HTTP pool is sized for this.
+    max_workers = max(1, min(int(getattr(settings, "OPENSTACK_PARALLEL_UPLOADS", 4)), len(qcow2_paths)))
+    disk_results: list[tuple[str, str] | None] = [None] * len(qcow2_paths)
+    if max_workers == 1:
+        # Single-disk VMs (or parallelism disabled): no pool to spin up.
+        disk_results = [_deploy_disk(idx, path) for idx, path in enumerate(qcow2_paths)]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_deploy_disk, idx, path): idx for idx, path in enumerate(qcow2_paths)}
+            try:
+                for future in as_completed(futures):
+                    disk_results[futures[future]] = future.result()
+            except BaseException:
+                # Fail fast: drop queued disks; uploads already running finish on their own.
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+    image_ids = [image_id for image_id, _ in disk_results]
+    converted_volume_ids = [volume_id for _, volume_id in disk_results]
 
     if len(converted_volume_ids) != len(qcow2_paths):
         raise OpenStackDeploymentError(
@@ -1148,25 +1739,21 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
     primary_image_id = image_ids[primary_disk_index]
     primary_volume_id = converted_volume_ids[primary_disk_index]
 
-    server_id = ensure_server_booted_from_volume(
+    # Wait for Nova to finish server build before attaching non-boot volumes.
+    server_id = boot_and_wait_active(
         conn,
-        server_name=names["server_name"],
+        server_name=server_base,
         boot_volume_id=primary_volume_id,
         flavor_id=flavor.id,
         network_id=network.id,
         fixed_ip=target_spec["fixed_ip"],
         existing_server_id=os_meta.get("server_id"),
-        retries=int(getattr(settings, "OPENSTACK_API_RETRIES", 2)),
-        retry_delay_seconds=int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3)),
-    )
-
-    # Wait for Nova to finish server build before attaching non-boot volumes.
-    server_ready_status = verify_server_active(
-        conn,
-        server_id=server_id,
-        timeout_seconds=int(getattr(settings, "OPENSTACK_VERIFY_TIMEOUT", 900)),
-        poll_interval_seconds=int(getattr(settings, "OPENSTACK_VERIFY_POLL_INTERVAL", 10)),
+        timeout_seconds=verify_timeout,
+        poll_interval_seconds=verify_poll_interval,
+        retries=retries,
+        retry_delay_seconds=retry_delay,
     )
+    server_ready_status = "ACTIVE"
 
     for idx, volume_id in enumerate(converted_volume_ids):
         if idx == primary_disk_index:
@@ -1185,8 +1772,8 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             conn,
             server_id=server_id,
             volume_id=volume_id,
-            retries=int(getattr(settings, "OPENSTACK_API_RETRIES", 2)),
-            retry_delay_seconds=int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3)),
+            retries=retries,
+            retry_delay_seconds=retry_delay,
         )
         attached_volumes.append(
             {
@@ -1202,7 +1789,7 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
     extra_volume_ids = os_meta.get("extra_volume_ids") if isinstance(os_meta.get("extra_volume_ids"), list) else []
     requested_extra_disks = target_spec["extra_disks_gb"]
     for extra_idx, size_gb in enumerate(requested_extra_disks, start=1):
-        vol_name = f"{names['server_name']}-extra{extra_idx}"
+        vol_name = f"{server_base}-extra{extra_idx}"
         existing_extra_volume_id = None
         if (extra_idx - 1) < len(extra_volume_ids) and isinstance(extra_volume_ids[extra_idx - 1], str):
             existing_extra_volume_id = extra_volume_ids[extra_idx - 1]
@@ -1212,10 +1799,10 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             volume_name=vol_name,
             size_gb=size_gb,
             existing_volume_id=existing_extra_volume_id,
-            timeout_seconds=int(getattr(settings, "OPENSTACK_VERIFY_TIMEOUT", 900)),
-            poll_interval_seconds=int(getattr(settings, "OPENSTACK_IMAGE_UPLOAD_POLL_INTERVAL", 5)),
-            retries=int(getattr(settings, "OPENSTACK_API_RETRIES", 2)),
-            retry_delay_seconds=int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3)),
+            timeout_seconds=verify_timeout,
+            poll_interval_seconds=upload_poll_interval,
+            retries=retries,
+            retry_delay_seconds=retry_delay,
         )
         extra_volume_ids.append(volume_id)
 
@@ -1223,8 +1810,8 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             conn,
             server_id=server_id,
             volume_id=volume_id,
-            retries=int(getattr(settings, "OPENSTACK_API_RETRIES", 2)),
-            retry_delay_seconds=int(getattr(settings, "OPENSTACK_API_RETRY_DELAY", 3)),
+            retries=retries,
+            retry_delay_seconds=retry_delay,
         )
         attached_volumes.append(
             {
@@ -1241,8 +1828,8 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             "cloud": cloud,
             "image_id": primary_image_id,
             "image_ids": image_ids,
-            "image_name": names["image_name"],
-            "image_names": [names["image_name"]] + [f"{names['image_name']}-disk{i}" for i in range(1, len(image_ids))],
+            "image_name": image_base,
+            "image_names": image_names,
             "source_qcow2_paths": qcow2_paths,
             "source_disk_count": len(qcow2_paths),
             "output_disk_format": output_disk_format,
@@ -1254,7 +1841,7 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             "network_name": network.name,
             "fixed_ip": target_spec["fixed_ip"],
             "server_id": server_id,
-            "server_name": names["server_name"],
+            "server_name": server_base,
             "server_status_before_attach": server_ready_status,
             "boot_volume_id": primary_volume_id,
             "boot_disk_index": primary_disk_index,
@@ -1268,19 +1855,69 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
     metadata["openstack"] = os_meta
     job.conversion_metadata = metadata
 
+    # One write for the DEPLOYED status and the created resource ids: verification can
+    # take minutes, and a worker lost meanwhile must still leave rollback what to delete.
     if job.status == MigrationJob.Status.UPLOADING and job.can_transition_to(MigrationJob.Status.DEPLOYED):
-        job.transition(MigrationJob.Status.DEPLOYED)
+        job.transition(MigrationJob.Status.DEPLOYED, save=False)
+    job.save(update_fields=["status", "conversion_metadata", "updated_at"])
 
+    return _verify_openstack_deployment(
+        job,
+        conn,
+        metadata,
+        os_meta,
+        verify_timeout=verify_timeout,
+        verify_poll_interval=verify_poll_interval,
+        attachments_known=_attachments_known(attached_volumes),
+    )
+
+
+def _openstack_deployment_recorded(os_meta: dict[str, Any], disk_count: int) -> bool:
+    """True when a previous run already created and attached every resource of this deployment."""
+    image_ids = os_meta.get("image_ids")
+    volume_ids = os_meta.get("volume_ids")
+    attached = os_meta.get("attached_volumes")
+    extra_volume_ids = os_meta.get("extra_volume_ids")
+    requested_extra = os_meta.get("requested_extra_disks_gb")
+    return (
+        isinstance(os_meta.get("server_id"), str)
+        and isinstance(image_ids, list)
+        and len(image_ids) == disk_count
+        and isinstance(volume_ids, list)
+        and len(volume_ids) == disk_count
+        and isinstance(extra_volume_ids, list)
+        and isinstance(requested_extra, list)
+        and len(extra_volume_ids) == len(requested_extra)
+        and isinstance(attached, list)
+        and len(attached) == disk_count + len(requested_extra)
+    )
+
+
+def _verify_openstack_deployment(
+    job: MigrationJob,
+    conn,
+    metadata: dict[str, Any],
+    os_meta: dict[str, Any],
+    *,
+    verify_timeout: int,
+    verify_poll_interval: int,
+    attachments_known: bool = False,
+) -> dict[str, Any]:
+    server_id = os_meta["server_id"]
+    volume_ids = os_meta["volume_ids"]
     verified_status = verify_server_active(
         conn,
         server_id=server_id,
-        timeout_seconds=int(getattr(settings, "OPENSTACK_VERIFY_TIMEOUT", 900)),
-        poll_interval_seconds=int(getattr(settings, "OPENSTACK_VERIFY_POLL_INTERVAL", 10)),
+        timeout_seconds=verify_timeout,
+        poll_interval_seconds=verify_poll_interval,
     )
 
     os_meta["server_status"] = verified_status
     os_meta["verified_at"] = timezone.now().isoformat()
-    attachment_validation = _validate_openstack_disk_attachments(conn, server_id, converted_volume_ids)
+    if attachments_known:
+        attachment_validation = _known_attachment_validation(volume_ids)
+    else:
+        attachment_validation = _validate_openstack_disk_attachments(conn, server_id, volume_ids)
     os_meta["disk_attachment_validation"] = attachment_validation
     if not attachment_validation.get("ok"):
         raise OpenStackDeploymentError(
@@ -1288,52 +1925,55 @@ def _run_openstack_deployment(job: MigrationJob, discovered_vm: DiscoveredVM) ->
             f"{attachment_validation.get('missing_or_not_in_use')}"
         )
 
+    metadata["openstack"] = os_meta
+    job.conversion_metadata = metadata
     if job.status == MigrationJob.Status.DEPLOYED and job.can_transition_to(MigrationJob.Status.VERIFIED):
-        job.transition(MigrationJob.Status.VERIFIED)
+        job.transition(MigrationJob.Status.VERIFIED, save=False)
 
-    job.conversion_metadata = metadata
-    job.save(update_fields=["status", "conversion_metadata", "updated_at"])
+    # Everything outside metadata["openstack"] is already persisted; send only that section.
+    job.save_metadata_section("openstack", update_fields=("status",))
 
     return {
         "job_id": job.id,
         "result": "deployed",
         "status": job.status,
-        "image_id": primary_image_id,
-        "image_ids": image_ids,
+        "image_id": os_meta.get("image_id"),
+        "image_ids": os_meta.get("image_ids"),
         "server_id": server_id,
-        "volume_ids": converted_volume_ids,
-        "flavor": {"id": flavor.id, "name": flavor.name},
-        "network": {"id": network.id, "name": network.name},
+        "volume_ids": volume_ids,
+        "flavor": {"id": os_meta.get("flavor_id"), "name": os_meta.get("flavor_name")},
+        "network": {"id": os_meta.get("network_id"), "name": os_meta.get("network_name")},
     }
 
 
-@shared_task(name="migrations.start_migration", max_retries=0, acks_late=True)
+@shared_task(name="migrations.start_migration", max_retries=0, acks_late=True, reject_on_worker_lost=True)
 def start_migration(job_id: int) -> dict[str, Any]:
     """Migration starter with conversion and optional OpenStack deployment."""
 
+    cfg = _conversion_settings()
     try:
-        try:
-            job = MigrationJob.objects.get(id=job_id)
-        except MigrationJob.DoesNotExist:
-            logger.error("migration.start missing job", extra={"job_id": job_id})
-            return {"job_id": job_id, "result": "missing"}
-
-        logger.info(
-            "migration.start begin",
-            extra={"job_id": job.id, "vm_name": job.vm_name, "status": job.status},
-        )
-
-        discovered_vm: DiscoveredVM | None = None
-
-        # Keep DB transactions short: only lock+transition the job state here.
+        # Keep DB transactions short: only lock+transition the job state here. The locked
+        # read is the only fetch; the instance stays current after the save below.
         with transaction.atomic():
-            job = MigrationJob.objects.select_for_update().get(id=job_id)
+            try:
+                job = MigrationJob.objects.select_for_update().get(id=job_id)
+            except MigrationJob.DoesNotExist:
+                logger.error("migration.start missing job", extra={"job_id": job_id})
+                return {"job_id": job_id, "result": "missing"}
+
+            logger.info(
+                "migration.start begin",
+                extra={"job_id": job.id, "vm_name": job.vm_name, "status": job.status},
+            )
+            initial_status = job.status
             if job.status == MigrationJob.Status.PENDING:
-                job.transition(MigrationJob.Status.DISCOVERED)
+                job.transition(MigrationJob.Status.DISCOVERED, save=False)
             if job.status == MigrationJob.Status.DISCOVERED:
-                job.transition(MigrationJob.Status.CONVERTING)
+                job.transition(MigrationJob.Status.CONVERTING, save=False)
+            if job.status != initial_status:
+                job.save(update_fields=["status", "updated_at"])
 
-        job.refresh_from_db()
+        discovered_vm: DiscoveredVM | None = None
 
         # Conversion stage (may take minutes): no DB transaction should be held open here.
         if job.status == MigrationJob.Status.CONVERTING:
@@ -1350,14 +1990,14 @@ def start_migration(job_id: int) -> dict[str, Any]:
                     )
 
                 # Minimal snapshot guardrail: refuse to proceed if VM has snapshots (default).
-                require_no_snaps = bool(getattr(settings, "VMWARE_REQUIRE_NO_SNAPSHOTS", True))
+                require_no_snaps = cfg.vmware_require_no_snapshots
                 has_snaps = bool((discovered_vm.metadata or {}).get("has_snapshots"))
                 if require_no_snaps and has_snaps:
                     raise ConversionPlanningError(
                         f"ESXi VM '{discovered_vm.name}' has snapshots; consolidate/remove snapshots before conversion."
                     )
 
-                metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
+                metadata = _safe_meta(job)
                 vmware_endpoint_session_id = metadata.get("selected_vmware_endpoint_session_id")
                 vmware_session = None
                 if isinstance(vmware_endpoint_session_id, int):
@@ -1405,15 +2045,13 @@ def start_migration(job_id: int) -> dict[str, Any]:
             else:
                 raise ConversionPlanningError(f"Unsupported VMware source '{discovered_vm.source}'.")
 
-            real_conversion_enabled = bool(getattr(settings, "ENABLE_REAL_CONVERSION", False))
+            real_conversion_enabled = cfg.enable_real_conversion
             mode = "real" if real_conversion_enabled else "dry-run"
             if real_conversion_enabled:
                 _ensure_libguestfs_kernel_readable()
 
-            metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-            previous_execution: dict[str, Any] = {}
-            if isinstance(metadata.get("conversion"), dict) and isinstance(metadata["conversion"].get("execution"), dict):
-                previous_execution = metadata["conversion"]["execution"]
+            metadata = _safe_meta(job)
+            previous_execution = _dict_or(_dict_or(metadata, "conversion"), "execution")
 
             metadata.update(
                 _build_base_conversion_metadata(
@@ -1423,29 +2061,28 @@ def start_migration(job_id: int) -> dict[str, Any]:
                     mode=mode,
                 )
             )
+            # The base metadata just replaced the conversion section; every later write goes through this dict.
+            conv = metadata["conversion"]
 
             # Track temp dirs so rollback can clean them.
             if discovered_vm.source == DiscoveredVM.Source.ESXI:
-                temp_dirs = metadata.get("conversion", {}).get("temp_dirs")
-                if not isinstance(temp_dirs, list):
-                    temp_dirs = []
+                temp_dirs = conv.setdefault("temp_dirs", [])
                 temp_dir_str = str((Path(settings.MIGRATION_OUTPUT_DIR) / "tmp" / f"job-{job.id}"))
                 if temp_dir_str not in temp_dirs:
                     temp_dirs.append(temp_dir_str)
-                metadata["conversion"]["temp_dirs"] = temp_dirs
 
             # Preserve earlier execution metadata if present.
             if previous_execution:
-                metadata["conversion"]["execution"] = previous_execution
+                conv["execution"] = previous_execution
 
-            prior = metadata.get("conversion", {}).get("execution", {})
+            prior = conv.get("execution", {})
             if prior.get("state") == "succeeded" and prior.get("output_qcow2_path"):
                 out = Path(prior["output_qcow2_path"])
                 if out.exists() and out.is_file():
                     with transaction.atomic():
                         job = MigrationJob.objects.select_for_update().get(id=job_id)
                         if job.status == MigrationJob.Status.CONVERTING and job.can_transition_to(MigrationJob.Status.UPLOADING):
-                            job.transition(MigrationJob.Status.UPLOADING)
+                            job.transition(MigrationJob.Status.UPLOADING, save=False)
                         job.conversion_metadata = metadata
                         job.save(update_fields=["status", "conversion_metadata", "updated_at"])
                 else:
@@ -1479,9 +2116,9 @@ def start_migration(job_id: int) -> dict[str, Any]:
             # We do a short "compare-and-set" under a row lock, then release it before running virt-v2v.
             with transaction.atomic():
                 job = MigrationJob.objects.select_for_update().get(id=job_id)
-                db_meta = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-                db_conv = db_meta.get("conversion", {}) if isinstance(db_meta.get("conversion"), dict) else {}
-                db_exec = db_conv.get("execution", {}) if isinstance(db_conv.get("execution"), dict) else {}
+                db_meta = _safe_meta(job)
+                db_conv = _dict_or(db_meta, "conversion")
+                db_exec = _dict_or(db_conv, "execution")
                 if db_exec.get("state") == "running":
                     logger.info(
                         "migration.start conversion_already_running",
@@ -1493,7 +2130,7 @@ def start_migration(job_id: int) -> dict[str, Any]:
                         "status": job.status,
                     }
 
-                metadata["conversion"]["execution"] = {
+                conv["execution"] = {
                     "state": "running",
                     "started_at": timezone.now().isoformat(),
                 }
@@ -1502,58 +2139,60 @@ def start_migration(job_id: int) -> dict[str, Any]:
 
             if discovered_vm.source == DiscoveredVM.Source.WORKSTATION:
                 exec_result = _execute_workstation_qemu_pipeline(plan, discovered_vm.name)
-            elif bool(getattr(settings, "ENABLE_ANSIBLE_CONVERSION", False)):
+            elif cfg.enable_ansible_conversion:
                 exec_result = _execute_ansible_conversion(plan, discovered_vm.name)
             else:
                 exec_result = _execute_virt_v2v(plan, discovered_vm.name)
-            metadata["conversion"]["execution"] = {
+            conv["execution"] = {
                 "state": "succeeded",
                 **exec_result,
             }
 
             # Optional minimal artifact backup: keep a copy of the QCOW2 before OpenStack upload.
-            if bool(getattr(settings, "ENABLE_ARTIFACT_BACKUP", False)):
+            if cfg.enable_artifact_backup:
                 try:
                     src_paths = exec_result.get("output_qcow2_paths")
                     if not isinstance(src_paths, list) or not src_paths:
                         src_paths = [exec_result["output_qcow2_path"]]
-                    backup_root = Path(
-                        getattr(
-                            settings,
-                            "ARTIFACT_BACKUP_DIR",
-                            str(Path(settings.MIGRATION_OUTPUT_DIR) / "backups"),
-                        )
-                    ).expanduser()
-                    backup_dir = backup_root / f"job-{job.id}"
+                    backup_dir = cfg.artifact_backup_root / f"job-{job.id}"
                     backup_dir.mkdir(parents=True, exist_ok=True)
-                    backup_paths: list[str] = []
-                    for src_raw in src_paths:
+
+                    def _backup_one(src_raw: Any) -> tuple[str, str | None]:
                         src = Path(str(src_raw)).expanduser().resolve()
                         dst = backup_dir / src.name
-                        if not dst.exists():
-                            shutil.copy2(src, dst)
-                        backup_paths.append(str(dst))
-                    metadata["conversion"]["backup"] = {
+                        if _backup_is_current(src, dst):
+                            return str(dst), None
+                        return str(dst), _backup_artifact(
+                            src,
+                            dst,
+                            use_qemu_img=cfg.artifact_backup_use_qemu_img,
+                            allow_hardlink=cfg.artifact_backup_allow_hardlink,
+                        )
+
+                    # Copies are I/O bound (the GIL is released), so disks back up concurrently.
+                    # map() keeps source order: the first path is the primary disk's backup.
+                    parallelism = cfg.artifact_backup_parallelism
+                    with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(src_paths)))) as pool:
+                        backed_up = list(pool.map(_backup_one, src_paths))
+                    backup_paths = [path for path, _ in backed_up]
+                    backup_methods = [method for _, method in backed_up if method]
+                    conv["backup"] = {
                         "enabled": True,
                         "path": backup_paths[0] if backup_paths else "",
                         "paths": backup_paths,
-                        "method": "copy2",
+                        "method": ",".join(sorted(set(backup_methods))) or "existing",
                         "created_at": timezone.now().isoformat(),
                     }
                 except Exception as exc:
-                    if bool(getattr(settings, "ARTIFACT_BACKUP_REQUIRED", False)):
+                    if cfg.artifact_backup_required:
                         raise
-                    warnings = metadata["conversion"].get("warnings")
-                    if not isinstance(warnings, list):
-                        warnings = []
-                    warnings.append(f"artifact backup failed: {exc}")
-                    metadata["conversion"]["warnings"] = warnings
+                    conv.setdefault("warnings", []).append(f"artifact backup failed: {exc}")
 
             with transaction.atomic():
                 job = MigrationJob.objects.select_for_update().get(id=job_id)
                 job.conversion_metadata = metadata
                 if job.status == MigrationJob.Status.CONVERTING and job.can_transition_to(MigrationJob.Status.UPLOADING):
-                    job.transition(MigrationJob.Status.UPLOADING)
+                    job.transition(MigrationJob.Status.UPLOADING, save=False)
                 job.save(update_fields=["status", "conversion_metadata", "updated_at"])
 
             logger.info(
@@ -1566,12 +2205,7 @@ def start_migration(job_id: int) -> dict[str, Any]:
                 },
             )
 
-            job.refresh_from_db()
-
-        if job.status == MigrationJob.Status.UPLOADING and not discovered_vm:
-            discovered_vm = _find_discovered_vm_for_job(job)
-
-        if not getattr(settings, "ENABLE_OPENSTACK_DEPLOYMENT", False):
+        if not cfg.enable_openstack_deployment:
             return {
                 "job_id": job.id,
                 "result": "converted" if job.status in {MigrationJob.Status.UPLOADING, MigrationJob.Status.DEPLOYED, MigrationJob.Status.VERIFIED} else "skipped",
@@ -1582,7 +2216,8 @@ def start_migration(job_id: int) -> dict[str, Any]:
 
         if job.status in {MigrationJob.Status.UPLOADING, MigrationJob.Status.DEPLOYED}:
             if not discovered_vm:
-                discovered_vm = _find_discovered_vm_for_job(job)
+                # Deployment only reads cpu/ram; skip the disks/metadata JSON.
+                discovered_vm = _find_discovered_vm_for_job(job, defer_inventory=True)
             deploy_result = _run_openstack_deployment(job, discovered_vm)
             logger.info(
                 "migration.start openstack_deploy_success",
@@ -1603,18 +2238,18 @@ def start_migration(job_id: int) -> dict[str, Any]:
         }
 
     except ConversionExecutionError as exc:
-        metadata = job.conversion_metadata if isinstance(job.conversion_metadata, dict) else {}
-        conv = metadata.get("conversion", {}) if isinstance(metadata.get("conversion"), dict) else {}
+        metadata = _safe_meta(job)
+        conv = _dict_or(metadata, "conversion")
         conv["execution"] = {
             "state": "failed",
             "returncode": exc.returncode,
-            "stdout": _truncate_log(exc.stdout),
-            "stderr": _truncate_log(exc.stderr),
+            # Producers already bound their output to its last lines; a head cut would drop the error.
+            "stdout": exc.stdout,
+            "stderr": exc.stderr,
         }
         metadata["conversion"] = conv
         job.conversion_metadata = metadata
-        job.save(update_fields=["conversion_metadata", "updated_at"])
-
+        # Persisted together with the FAILED status and last_error in one save.
         _mark_job_failed(job, str(exc))
         _schedule_rollback(job, str(exc), extra_context={"output_qcow2_path": conv.get("output_qcow2_path")})
 
@@ -1667,6 +2302,56 @@ def start_migration(job_id: int) -> dict[str, Any]:
         }
 
 
+_DISCOVERED_VM_UPSERT_FIELDS = ["cpu", "ram", "disks", "metadata", "power_state", "last_seen"]
+
+
+def _upsert_discovered_vms(
+    source: str,
+    items: list[dict[str, Any]],
+    endpoint_session: VmwareEndpointSession | None,
+    now,
+) -> int:
+    """Insert or refresh one DiscoveredVM row per item, keyed on (name, source, endpoint session)."""
+    # Later duplicates win, as the old row-by-row upsert did; one statement cannot touch a row twice.
+    rows = {
+        item["name"]: DiscoveredVM(
+            name=item["name"],
+            source=source,
+            vmware_endpoint_session=endpoint_session,
+            cpu=item.get("cpu"),
+            ram=item.get("ram"),
+            disks=item.get("disks", []),
+            metadata=_dict_or(item, "metadata"),
+            power_state=item.get("power_state") or "",
+            last_seen=now,
+        )
+        for item in items
+    }
+    features = connections[router.db_for_write(DiscoveredVM)].features
+    # NULL endpoint sessions never conflict in a unique constraint, so those rows need the lookup path.
+    if endpoint_session is not None and features.supports_update_conflicts:
+        conflict_kwargs: dict[str, Any] = {}
+        if features.supports_update_conflicts_with_target:
+            conflict_kwargs["unique_fields"] = ["name", "source", "vmware_endpoint_session"]
+        DiscoveredVM.objects.bulk_create(
+            list(rows.values()),
+            update_conflicts=True,
+            update_fields=_DISCOVERED_VM_UPSERT_FIELDS,
+            batch_size=500,
+            **conflict_kwargs,
+        )
+        return len(items)
+
+    for row in rows.values():
+        DiscoveredVM.objects.update_or_create(
+            name=row.name,
+            source=source,
+            vmware_endpoint_session=endpoint_session,
+            defaults={field: getattr(row, field) for field in _DISCOVERED_VM_UPSERT_FIELDS},
+        )
+    return len(items)
+
+
 @shared_task(name="migrations.discover_vmware_vms", max_retries=2, default_retry_delay=15, acks_late=True)
 def discover_vmware_vms(
     include_workstation: bool = True,
@@ -1689,31 +2374,11 @@ def discover_vmware_vms(
         include_workstation = False
         include_esxi = True
 
-    def upsert_many(source: str, items: list[dict[str, Any]], endpoint_session: VmwareEndpointSession | None = None) -> int:
-        upserted = 0
-        for item in items:
-            defaults = {
-                "cpu": item.get("cpu"),
-                "ram": item.get("ram"),
-                "disks": item.get("disks", []),
-                "metadata": item.get("metadata", {}) if isinstance(item.get("metadata"), dict) else {},
-                "power_state": item.get("power_state") or "",
-                "last_seen": now,
-            }
-            DiscoveredVM.objects.update_or_create(
-                name=item["name"],
-                source=source,
-                vmware_endpoint_session=endpoint_session,
-                defaults=defaults,
-            )
-            upserted += 1
-        return upserted
-
     if include_workstation:
         try:
             ws_items = WorkstationVMwareClient().discover_vms()
             result["workstation"]["discovered"] = len(ws_items)
-            result["workstation"]["upserted"] = upsert_many(DiscoveredVM.Source.WORKSTATION, ws_items)
+            result["workstation"]["upserted"] = _upsert_discovered_vms(DiscoveredVM.Source.WORKSTATION, ws_items, None, now)
         except VMwareClientError as exc:
             result["workstation"]["errors"].append(str(exc))
 
@@ -1731,7 +2396,7 @@ def discover_vmware_vms(
                 esxi_client = ESXiVMwareClient.from_env()
             esxi_items = esxi_client.discover_vms()
             result["esxi"]["discovered"] = len(esxi_items)
-            result["esxi"]["upserted"] = upsert_many(DiscoveredVM.Source.ESXI, esxi_items, vmware_session)
+            result["esxi"]["upserted"] = _upsert_discovered_vms(DiscoveredVM.Source.ESXI, esxi_items, vmware_session, now)
         except VMwareClientError as exc:
             result["esxi"]["errors"].append(str(exc))
 
@@ -1,14 +1,62 @@
 from __future__ import annotations
 
+import errno
+import os
+import subprocess
+import threading
+import time
+from datetime import timedelta
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, TemporaryFile
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
 
+from .ansible_runner import _read_tail
 from .disk_formats import DiskConversionError, convert_with_qemu_img, detect_disk_format
-from .serializers import VMOverridesSerializer
+from .models import DiscoveredVM, MigrationJob, OpenstackEndpointSession, VmwareEndpointSession
+from .openstack_client import OpenStackClient
+from .openstack_deployment import (
+    OpenStackDeploymentError,
+    _clear_connection_cache,
+    _retry_call,
+    _tune_http_pool,
+    _wait_for_status,
+    boot_and_wait_active,
+    get_openstack_connection,
+)
+from .serializers import CreateMigrationFromVMwareSerializer, VMOverridesSerializer
+from .tasks import (
+    _VDDK_ENV_KEYS,
+    _LogTail,
+    _attachments_known,
+    _backup_artifact,
+    _backup_is_current,
+    _collect_cleanup_targets,
+    _conversion_settings,
+    _copy_times,
+    _effective_target_spec,
+    _fast_rmtree,
+    _fastcopy,
+    _find_output_qcow2_paths,
+    _normalize_disk_artifact_path,
+    _openstack_deployment_recorded,
+    _order_qcow2_paths_for_boot,
+    _parse_inspector_operating_systems,
+    _resolve_flavor_and_network,
+    _rollback_local_artifacts,
+    _rollback_openstack_resources,
+    _run_supervised,
+    _schedule_rollback,
+    _truncate_log,
+    _truncate_log_bytes,
+    _upsert_discovered_vms,
+    _validate_workstation_paths,
+    _vddk_env_overlay,
+)
 
 
 class DiskFormatDetectionTests(SimpleTestCase):
@@ -94,3 +142,723 @@ class DiskPolicySerializerTests(SimpleTestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn("Disk concatenation/merge is not allowed", str(serializer.errors))
 
+
+class CreateMigrationFromVMwareSerializerTests(TestCase):
+    def _errors(self, vmware_session_id, openstack_session_id, vms):
+        serializer = CreateMigrationFromVMwareSerializer(
+            data={
+                "vmware_endpoint_session_id": vmware_session_id,
+                "openstack_endpoint_session_id": openstack_session_id,
+                "vms": vms,
+            }
+        )
+        self.assertFalse(serializer.is_valid())
+        return serializer.errors
+
+    def test_session_errors_are_reported_under_vms_before_duplicates(self):
+        vm = {"name": "web", "source": DiscoveredVM.Source.ESXI}
+        errors = self._errors(999, 999, [vm, vm])
+        self.assertEqual(list(errors), ["vms"])
+        self.assertEqual(str(errors["vms"][0]), "Invalid vmware_endpoint_session_id.")
+
+    def test_duplicates_are_reported_under_vms(self):
+        vmware = VmwareEndpointSession.objects.create(host="esxi", username="root", password="x")
+        openstack = OpenstackEndpointSession.objects.create(
+            auth_url="http://ks", username="admin", password="x", project_name="demo"
+        )
+        vm = {"name": "web", "source": DiscoveredVM.Source.ESXI}
+        errors = self._errors(vmware.id, openstack.id, [vm, vm])
+        self.assertIn("Duplicate VM selections", str(errors["vms"][0]))
+
+
+class BootAndWaitActiveTests(SimpleTestCase):
+    def _conn(self):
+        conn = MagicMock()
+        conn.compute.find_server.return_value = None
+        conn.compute.create_server.return_value = SimpleNamespace(id="srv-1")
+        return conn
+
+    def test_waits_on_created_server_without_extra_get(self):
+        conn = self._conn()
+        server_id = boot_and_wait_active(
+            conn,
+            server_name="vm-migrator-1-web",
+            boot_volume_id="vol-1",
+            flavor_id="flv-1",
+            network_id="net-1",
+            poll_interval_seconds=3,
+            timeout_seconds=60,
+        )
+        self.assertEqual(server_id, "srv-1")
+        conn.compute.get_server.assert_not_called()
+        waited_on = conn.compute.wait_for_server.call_args
+        self.assertIs(waited_on.args[0], conn.compute.create_server.return_value)
+        self.assertEqual(waited_on.kwargs["failures"], ["ERROR"])
+        self.assertEqual(waited_on.kwargs["interval"], 3)
+        self.assertEqual(waited_on.kwargs["wait"], 60)
+        bdm = conn.compute.create_server.call_args.kwargs["block_device_mapping_v2"]
+        self.assertEqual(bdm[0]["uuid"], "vol-1")
+
+    def test_error_state_maps_to_deployment_error(self):
+        from openstack import exceptions as os_exceptions
+
+        conn = self._conn()
+        conn.compute.wait_for_server.side_effect = os_exceptions.ResourceFailure("boom")
+        with self.assertRaises(OpenStackDeploymentError):
+            boot_and_wait_active(
+                conn,
+                server_name="vm-migrator-1-web",
+                boot_volume_id="vol-1",
+                flavor_id="flv-1",
+                network_id="net-1",
+            )
+
+
+class WaitForStatusTests(SimpleTestCase):
+    def _wait(self, resource, fetch, cancel_event, timeout_seconds=60):
+        return _wait_for_status(
+            MagicMock(),
+            resource,
+            fetch=fetch,
+            what="volume 'v'",
+            status="available",
+            failures=["error"],
+            timeout_seconds=timeout_seconds,
+            poll_interval_seconds=30,
+            cancel_event=cancel_event,
+        )
+
+    def test_cancel_interrupts_the_inter_poll_wait(self):
+        cancel_event = threading.Event()
+        threading.Timer(0.1, cancel_event.set).start()
+        started = time.monotonic()
+        with self.assertRaisesMessage(OpenStackDeploymentError, "canceled"):
+            self._wait(SimpleNamespace(id="v", status="creating"), MagicMock(), cancel_event)
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_refetches_until_status_reached(self):
+        fetch = MagicMock(return_value=SimpleNamespace(id="v", status="available"))
+        with patch.object(threading.Event, "wait", return_value=False):
+            done = self._wait(SimpleNamespace(id="v", status="creating"), fetch, threading.Event())
+        self.assertEqual(done.status, "available")
+        fetch.assert_called_once_with("v")
+
+
+@patch("migrations.openstack_deployment.time.sleep")
+class RetryCallTests(SimpleTestCase):
+    def test_retries_transient_errors(self, sleep_mock):
+        from openstack import exceptions as os_exceptions
+
+        fn = MagicMock(side_effect=[os_exceptions.HttpException("busy", http_status=503), "ok"])
+        self.assertEqual(_retry_call("image upload", 2, 1, fn), "ok")
+        self.assertEqual(fn.call_count, 2)
+
+    def test_client_errors_fail_without_retry(self, sleep_mock):
+        from openstack import exceptions as os_exceptions
+
+        fn = MagicMock(side_effect=os_exceptions.BadRequestException("bad", http_status=400))
+        with self.assertRaises(OpenStackDeploymentError):
+            _retry_call("volume create", 3, 1, fn)
+        self.assertEqual(fn.call_count, 1)
+        sleep_mock.assert_not_called()
+
+    def test_non_transient_errors_are_wrapped_without_retry(self, sleep_mock):
+        from keystoneauth1 import exceptions as ks_exceptions
+        from openstack import exceptions as os_exceptions
+
+        for error in (
+            ks_exceptions.Unauthorized("expired"),
+            ks_exceptions.EndpointNotFound("no image endpoint"),
+            os_exceptions.InvalidRequest("bad"),
+            OSError("unreadable upload file"),
+        ):
+            fn = MagicMock(side_effect=error)
+            with self.assertRaises(OpenStackDeploymentError):
+                _retry_call("server boot", 3, 1, fn)
+            self.assertEqual(fn.call_count, 1)
+        sleep_mock.assert_not_called()
+
+    def test_connection_failures_are_retried(self, sleep_mock):
+        from keystoneauth1 import exceptions as ks_exceptions
+
+        fn = MagicMock(side_effect=[ks_exceptions.ConnectFailure("reset"), "ok"])
+        self.assertEqual(_retry_call("volume create", 2, 1, fn), "ok")
+
+
+class OpenStackConnectionCacheTests(SimpleTestCase):
+    def setUp(self):
+        _clear_connection_cache()
+        self.addCleanup(_clear_connection_cache)
+
+    @patch("migrations.openstack_deployment.connect_openstack")
+    def test_reuses_connection_for_same_credentials(self, connect_mock):
+        connect_mock.side_effect = lambda **kwargs: MagicMock()
+        first = get_openstack_connection("openstack", {"auth_url": "http://ks", "username": "a"})
+        again = get_openstack_connection("openstack", {"username": "a", "auth_url": "http://ks"})
+        other = get_openstack_connection("openstack", {"auth_url": "http://ks", "username": "b"})
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual(connect_mock.call_count, 2)
+
+    @patch("migrations.openstack_deployment._CONNECTION_CACHE_MAX", 1)
+    @patch("migrations.openstack_deployment.connect_openstack")
+    def test_evicted_connection_is_closed(self, connect_mock):
+        connect_mock.side_effect = lambda **kwargs: MagicMock()
+        first = get_openstack_connection("openstack", {"username": "a"})
+        second = get_openstack_connection("openstack", {"username": "b"})
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+
+
+class TuneHttpPoolTests(SimpleTestCase):
+    def test_keeps_keystoneauth_keepalive_adapter(self):
+        from keystoneauth1.session import Session, TCPKeepAliveAdapter
+
+        ks_session = Session()
+        _tune_http_pool(SimpleNamespace(session=ks_session))
+
+        adapter = ks_session.session.adapters["https://"]
+        self.assertIsInstance(adapter, TCPKeepAliveAdapter)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 0)
+
+
+class OpenStackClientIndexTests(SimpleTestCase):
+    def _client(self):
+        client = OpenStackClient.__new__(OpenStackClient)
+        client._conn = MagicMock()
+        return client
+
+    def test_network_index_requests_id_and_name_only(self):
+        client = self._client()
+        client._conn.network.networks.return_value = [
+            SimpleNamespace(id="net-1", name="private"),
+            SimpleNamespace(id="net-2", name="private"),
+            SimpleNamespace(id="net-3", name=None),
+        ]
+        network_ids, ids_by_name = client.list_network_index()
+        client._conn.network.networks.assert_called_once_with(fields=["id", "name"])
+        self.assertEqual(network_ids, {"net-1", "net-2", "net-3"})
+        self.assertEqual(ids_by_name, {"private": ["net-1", "net-2"]})
+
+    def test_flavor_ids_use_summary_listing(self):
+        client = self._client()
+        client._conn.compute.flavors.return_value = [SimpleNamespace(id="flv-1"), SimpleNamespace(id="flv-2")]
+        self.assertEqual(client.list_flavor_ids(), {"flv-1", "flv-2"})
+        client._conn.compute.flavors.assert_called_once_with(details=False)
+
+    def test_fixed_ips_on_one_network_share_lookups(self):
+        client = self._client()
+        client._conn.network.subnets.return_value = [
+            SimpleNamespace(
+                gateway_ip="10.0.0.1",
+                allocation_pools=[{"start": "10.0.0.10", "end": "10.0.0.20"}],
+                cidr="10.0.0.0/24",
+            )
+        ]
+        client._conn.network.ports.return_value = [SimpleNamespace(fixed_ips=[{"ip_address": "10.0.0.11"}])]
+        results = client.validate_fixed_ips([("net-1", "10.0.0.10"), ("net-1", "10.0.0.11"), ("net-1", "10.0.0.50")])
+        self.assertEqual(
+            results,
+            [(True, None), (False, "IP is already in use."), (False, "IP is not inside any allocation pool.")],
+        )
+        client._conn.network.find_network.assert_called_once_with("net-1", ignore_missing=True)
+        client._conn.network.ports.assert_called_once_with(network_id="net-1")
+
+
+class FindOutputQcow2PathsTests(SimpleTestCase):
+    def test_collects_vm_artifacts_and_skips_xml(self):
+        with TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            for name, payload in (("web-sda", b"xx"), ("web-sdb.qcow2", b"x"), ("web.xml", b"x"), ("other-sda", b"x")):
+                (out_dir / name).write_bytes(payload)
+            (out_dir / "web-dir").mkdir()
+
+            found = _find_output_qcow2_paths(str(out_dir / "web.qcow2"), "web")
+
+            self.assertEqual([(p.name, size) for p, size in found], [("web-sda.qcow2", 2), ("web-sdb.qcow2", 1)])
+
+    def test_existing_qcow2_name_reports_its_own_size(self):
+        with TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            (out_dir / "web-sda").write_bytes(b"x")
+            (out_dir / "web-sda.qcow2").write_bytes(b"xxxx")
+
+            found = _find_output_qcow2_paths(str(out_dir / "web.qcow2"), "web")
+
+            self.assertEqual([(p.name, size) for p, size in found], [("web-sda.qcow2", 4)])
+
+
+class ValidateWorkstationPathsTests(SimpleTestCase):
+    def test_probes_keep_input_order_and_sum_sizes(self):
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a.vmdk").write_bytes(b"xxx")
+            (root / "c.vmdk").write_bytes(b"x")
+            disks = [str(root / "a.vmdk"), str(root / "b.vmdk"), str(root / "c.vmdk")]
+
+            result = _validate_workstation_paths(disks, str(root / "out" / "vm.qcow2"))
+
+            self.assertEqual([item["path"] for item in result["checked_paths"]], disks)
+            self.assertEqual([item["exists"] for item in result["checked_paths"]], [True, False, True])
+            self.assertEqual(result["total_input_size_bytes"], 4)
+            self.assertEqual(result["errors"], [f"Missing disk path: {root / 'b.vmdk'}"])
+
+
+class NormalizeDiskArtifactPathTests(SimpleTestCase):
+    def test_unlink_failure_keeps_the_new_link(self):
+        with TemporaryDirectory() as tmp:
+            src = Path(tmp) / "web-sda"
+            src.write_bytes(b"disk")
+            with patch.object(Path, "unlink", side_effect=PermissionError("read-only dir")):
+                normalized = _normalize_disk_artifact_path(src)
+            self.assertEqual(normalized, Path(tmp) / "web-sda.qcow2")
+            self.assertEqual(normalized.read_bytes(), b"disk")
+
+
+class InspectorXmlParsingTests(SimpleTestCase):
+    def test_reads_os_name_and_mountpoints_but_not_application_names(self):
+        xml = (
+            b"<operatingsystems><operatingsystem><name>linux</name>"
+            b"<mountpoints><mountpoint dev='/dev/sda2'>/</mountpoint>"
+            b"<mountpoint dev='/dev/sda1'>/boot</mountpoint></mountpoints>"
+            b"<applications><application><name>bash</name></application></applications>"
+            b"</operatingsystem></operatingsystems>"
+        )
+        self.assertEqual(_parse_inspector_operating_systems(xml), [("linux", ["/", "/boot"])])
+
+    def test_no_operating_system(self):
+        self.assertEqual(_parse_inspector_operating_systems(b"<operatingsystems/>"), [])
+
+
+class CollectCleanupTargetsTests(SimpleTestCase):
+    def test_dedupes_in_order_and_keeps_backups(self):
+        job = SimpleNamespace(
+            conversion_metadata={
+                "conversion": {
+                    "output_path": "/out/web.qcow2",
+                    "execution": {
+                        "output_qcow2_path": " /out/web.qcow2 ",
+                        "output_qcow2_paths": ["/out/web-sda.qcow2", "/out/web.qcow2", "/bak/web.qcow2", 7],
+                    },
+                    "backup": {"paths": ["/bak/web.qcow2"]},
+                    "temp_dirs": ["/tmp/a", "/tmp/b"],
+                }
+            }
+        )
+        files, dirs = _collect_cleanup_targets(job, {"temp_dirs": ["/tmp/b", "/tmp/a"]})
+        self.assertEqual(files, [Path("/out/web.qcow2"), Path("/out/web-sda.qcow2")])
+        self.assertEqual(dirs, [Path("/tmp/b"), Path("/tmp/a")])
+
+
+class VddkEnvOverlayTests(SimpleTestCase):
+    def _snapshot(self, **values):
+        return tuple(values.get(key, "") for key in _VDDK_ENV_KEYS)
+
+    def test_no_overlay_without_vddk_transport(self):
+        self.assertEqual(_vddk_env_overlay(self._snapshot(VMWARE_VDDK_LIBDIR="/opt/vddk")), {})
+
+    def test_vddk_overlay_prefixes_search_paths(self):
+        overlay = _vddk_env_overlay(
+            self._snapshot(
+                VMWARE_ESXI_CONVERSION_TRANSPORT="vddk",
+                VMWARE_NBDKIT_BIN="/opt/nbdkit/bin/nbdkit",
+                VMWARE_VDDK_LIBDIR="/opt/vddk",
+                PATH="/usr/bin",
+                LD_LIBRARY_PATH="/usr/lib",
+            )
+        )
+        self.assertEqual(overlay["PATH"], "/opt/nbdkit/bin:/usr/bin")
+        self.assertEqual(overlay["LD_LIBRARY_PATH"], "/opt/vddk/lib64:/usr/lib")
+        self.assertNotIn("NBDKIT_PLUGIN_PATH", overlay)
+
+
+@patch("migrations.tasks._inspect_disk_for_system_filesystem")
+class OrderQcow2PathsForBootTests(SimpleTestCase):
+    paths = [Path("/out/web-sda.qcow2"), Path("/out/web-sdb.qcow2")]
+
+    def test_confirmed_sda_disk_skips_other_inspections(self, inspect_mock):
+        inspect_mock.return_value = {"path": "/out/web-sda.qcow2", "score": 20}
+        _, primary, index, analysis = _order_qcow2_paths_for_boot(self.paths, "web", {})
+        inspect_mock.assert_called_once_with(self.paths[0])
+        self.assertEqual((primary, index), (self.paths[0], 0))
+        self.assertEqual(analysis[0]["reason"], "sda_convention_confirmed")
+        self.assertTrue(analysis[1]["skipped"])
+
+    def test_unconfirmed_sda_disk_inspects_all(self, inspect_mock):
+        inspect_mock.side_effect = lambda p: {"path": str(p), "score": 0 if p.name.endswith("sda.qcow2") else 20}
+        _, primary, _, _ = _order_qcow2_paths_for_boot(self.paths, "web", {})
+        self.assertEqual(inspect_mock.call_count, 3)
+        self.assertEqual(primary, self.paths[1])
+
+
+class RunSupervisedTests(SimpleTestCase):
+    def test_grandchild_holding_pipes_does_not_outlive_deadline(self):
+        started = time.monotonic()
+        returncode, stdout, _ = _run_supervised(["sh", "-c", "(sleep 4 &); echo done"], env=None, timeout_seconds=1)
+
+        self.assertLess(time.monotonic() - started, 3)
+        self.assertEqual((returncode, stdout), (0, "done\n"))
+
+    def test_failed_wait_kills_child(self):
+        spawned = []
+        real_popen = subprocess.Popen
+
+        def spawn(*args, **kwargs):
+            spawned.append(real_popen(*args, **kwargs))
+            return spawned[-1]
+
+        with patch("migrations.tasks.subprocess.Popen", side_effect=spawn), patch(
+            "migrations.tasks._wait_for_exit", side_effect=ValueError("filedescriptor out of range")
+        ):
+            with self.assertRaises(ValueError):
+                _run_supervised(["sleep", "30"], env=None, timeout_seconds=60)
+
+        self.assertIsNotNone(spawned[0].returncode)
+
+
+class TruncateLogBytesTests(SimpleTestCase):
+    def test_short_output_is_decoded_whole(self):
+        self.assertEqual(_truncate_log_bytes(b"ok\n", 10), "ok\n")
+
+    def test_long_output_keeps_tail_only(self):
+        self.assertEqual(_truncate_log_bytes(b"abcdef", 3), "...[truncated]\ndef")
+
+
+class LogTailTests(SimpleTestCase):
+    def test_character_bound_keeps_last_lines(self):
+        tail = _LogTail(max_lines=100, max_chars=10)
+        for line in ("first\n", "second\n", "error\n"):
+            tail.append(line)
+
+        self.assertEqual(tail.text(), "...[2 earlier lines truncated]\nerror\n")
+
+    def test_truncate_log_keeps_end(self):
+        self.assertEqual(_truncate_log("abcdef", 3), "...[truncated]\ndef")
+        self.assertEqual(_truncate_log(None), "")
+
+
+class ConversionSettingsTests(SimpleTestCase):
+    def test_snapshot_follows_override_settings(self):
+        self.assertEqual(_conversion_settings().qemu_img_parallelism, 4)
+        with override_settings(QEMU_IMG_PARALLELISM=2, OPENSTACK_OUTPUT_DISK_FORMAT=" RAW "):
+            self.assertEqual(_conversion_settings().qemu_img_parallelism, 2)
+            self.assertEqual(_conversion_settings().output_disk_format, "raw")
+        self.assertEqual(_conversion_settings().qemu_img_parallelism, 4)
+
+    def test_feature_flags_follow_override_settings(self):
+        with override_settings(ENABLE_ARTIFACT_BACKUP=True, ENABLE_OPENSTACK_DEPLOYMENT=True):
+            cfg = _conversion_settings()
+            self.assertTrue(cfg.enable_artifact_backup)
+            self.assertTrue(cfg.enable_openstack_deployment)
+        self.assertFalse(_conversion_settings().enable_openstack_deployment)
+
+    def test_backup_root_is_expanded(self):
+        with override_settings(ARTIFACT_BACKUP_DIR="~/vm-backups"):
+            self.assertEqual(_conversion_settings().artifact_backup_root, Path("~/vm-backups").expanduser())
+
+
+class AnsibleReadTailTests(SimpleTestCase):
+    def test_short_output_is_returned_whole(self):
+        with TemporaryFile() as spool:
+            spool.write(b"ok\n")
+            self.assertEqual(_read_tail(spool, 100), "ok\n")
+
+    def test_long_output_keeps_tail_within_limit(self):
+        with TemporaryFile() as spool:
+            spool.write(b"x" * 5000 + b"fatal: failed\n")
+            tail = _read_tail(spool, 100)
+        self.assertLessEqual(len(tail), 100)
+        self.assertTrue(tail.startswith("...[earlier output truncated]"))
+        self.assertTrue(tail.endswith("fatal: failed\n"))
+
+
+class FastRmtreeTests(SimpleTestCase):
+    def test_removes_nested_tree(self):
+        with TemporaryDirectory() as tmp:
+            target = Path(tmp) / "v2v-tmp"
+            (target / "nested").mkdir(parents=True)
+            (target / "nested" / "disk.part").write_bytes(b"x")
+            _fast_rmtree(target)
+            self.assertFalse(target.exists())
+
+
+class FastcopyTests(SimpleTestCase):
+    def _src(self, tmp):
+        src = Path(tmp) / "disk.qcow2"
+        src.write_bytes(b"qcow" * 4096)
+        os.utime(src, ns=(1_000_000_000, 2_000_000_000))
+        return src
+
+    def test_copies_content_and_times(self):
+        with TemporaryDirectory() as tmp:
+            src = self._src(tmp)
+            dst = Path(tmp) / "backup.qcow2"
+            method = _fastcopy(src, dst)
+            self.assertIn(method, {"copy_file_range", "copyfile"})
+            self.assertEqual(dst.read_bytes(), src.read_bytes())
+            self.assertEqual(dst.stat().st_mtime_ns, 2_000_000_000)
+
+    def test_falls_back_when_copy_file_range_unsupported(self):
+        with TemporaryDirectory() as tmp:
+            src = self._src(tmp)
+            dst = Path(tmp) / "backup.qcow2"
+            with patch("migrations.tasks.os.copy_file_range", side_effect=OSError(errno.EXDEV, "cross-device"), create=True):
+                self.assertEqual(_fastcopy(src, dst), "copyfile")
+            self.assertEqual(dst.read_bytes(), src.read_bytes())
+
+
+class BackupArtifactTests(SimpleTestCase):
+    def test_backup_is_current(self):
+        with TemporaryDirectory() as tmp:
+            src = Path(tmp) / "disk.qcow2"
+            src.write_bytes(b"data")
+            dst = Path(tmp) / "backup.qcow2"
+            self.assertFalse(_backup_is_current(src, dst))
+            _backup_artifact(src, dst, use_qemu_img=False)
+            self.assertTrue(_backup_is_current(src, dst))
+            dst.write_bytes(b"da")  # truncated by an interrupted copy
+            self.assertFalse(_backup_is_current(src, dst))
+
+    def test_converted_backup_of_other_size_is_current(self):
+        with TemporaryDirectory() as tmp:
+            src = Path(tmp) / "disk.qcow2"
+            src.write_bytes(b"data")
+            dst = Path(tmp) / "backup.qcow2"
+            dst.write_bytes(b"compacted-by-qemu-img")
+            self.assertFalse(_backup_is_current(src, dst))
+            _copy_times(src, dst)  # stamped once qemu-img convert finished
+            self.assertTrue(_backup_is_current(src, dst))
+
+    def test_hardlink_shares_inode(self):
+        with TemporaryDirectory() as tmp:
+            src = Path(tmp) / "disk.qcow2"
+            src.write_bytes(b"data")
+            dst = Path(tmp) / "backup.qcow2"
+            self.assertEqual(_backup_artifact(src, dst, use_qemu_img=False, allow_hardlink=True), "hardlink")
+            self.assertEqual(dst.stat().st_ino, src.stat().st_ino)
+
+    def test_hardlink_failure_falls_back_to_copy(self):
+        with TemporaryDirectory() as tmp:
+            src = Path(tmp) / "disk.qcow2"
+            src.write_bytes(b"data")
+            dst = Path(tmp) / "backup.qcow2"
+            with patch("migrations.tasks.os.link", side_effect=OSError(errno.EXDEV, "cross-device")):
+                method = _backup_artifact(src, dst, use_qemu_img=False, allow_hardlink=True)
+            self.assertNotEqual(method, "hardlink")
+            self.assertEqual(dst.read_bytes(), b"data")
+
+    def test_qemu_img_failure_falls_back_to_copy(self):
+        with TemporaryDirectory() as tmp:
+            src = Path(tmp) / "disk.qcow2"
+            src.write_bytes(b"QFI\xfb" + b"\0" * 1020)
+            dst = Path(tmp) / "backup.qcow2"
+            with patch("migrations.tasks.convert_with_qemu_img", side_effect=DiskConversionError("boom")) as convert:
+                # assertLogs also keeps the warning out of the configured worker log file.
+                with self.assertLogs("migrations.tasks", "WARNING") as logs:
+                    method = _backup_artifact(src, dst, use_qemu_img=True)
+            self.assertIn("migration.backup qemu_img_failed", logs.output[0])
+            convert.assert_called_once()
+            self.assertEqual(convert.call_args.kwargs["target_format"], "qcow2")
+            self.assertNotEqual(method, "qemu-img-convert")
+            self.assertEqual(dst.read_bytes(), src.read_bytes())
+
+
+class RollbackOpenStackResourcesTests(SimpleTestCase):
+    @patch("migrations.tasks.cleanup_resources")
+    @patch("migrations.tasks.get_openstack_connection")
+    def test_cleanup_results_become_actions(self, connect_mock, cleanup_mock):
+        cleanup_mock.return_value = {
+            "servers": {"srv-1": "deleted"},
+            "volumes": {"vol-1": "error: busy"},
+            "images": {"img-1": "not_found"},
+        }
+        job = SimpleNamespace(
+            conversion_metadata={
+                "openstack": {"server_id": "srv-1", "volume_ids": ["vol-1"], "image_id": "img-1"},
+            }
+        )
+        actions = []
+        _rollback_openstack_resources(job, actions)
+        cleanup_mock.assert_called_once_with(
+            connect_mock.return_value, server_ids=["srv-1"], volume_ids=["vol-1"], image_ids=["img-1"]
+        )
+        self.assertEqual(
+            actions,
+            [
+                {"action": "delete_server", "server_id": "srv-1", "status": "deleted"},
+                {"action": "delete_volume", "volume_id": "vol-1", "status": "error", "error": "busy"},
+                {"action": "delete_image", "image_id": "img-1", "status": "not_found"},
+            ],
+        )
+
+
+class EffectiveTargetSpecTests(SimpleTestCase):
+    def test_normalizes_requested_overrides(self):
+        job = SimpleNamespace(
+            conversion_metadata={
+                "requested_spec": {
+                    "flavor_id": "  ",
+                    "cpu": 4,
+                    "ram": True,
+                    "network": {"network_name": " private ", "fixed_ip": "10.0.0.5"},
+                    "extra_disks_gb": [10, 0, "5", 20],
+                }
+            }
+        )
+        spec = _effective_target_spec(job, SimpleNamespace(cpu=2, ram=2048))
+        self.assertEqual(
+            spec,
+            {
+                "flavor_id": None,
+                "cpu": 4,
+                "ram": 2048,
+                "network_id": None,
+                "network_name": "private",
+                "fixed_ip": "10.0.0.5",
+                "extra_disks_gb": [10, 20],
+            },
+        )
+
+
+class RollbackLocalArtifactsTests(SimpleTestCase):
+    def test_reports_deleted_and_missing_paths(self):
+        with TemporaryDirectory() as tmp:
+            disk = Path(tmp) / "web-sda.qcow2"
+            disk.write_bytes(b"x")
+            work_dir = Path(tmp) / "v2v"
+            work_dir.mkdir()
+            actions = []
+            _rollback_local_artifacts([disk, Path(tmp) / "gone.qcow2"], [work_dir, Path(tmp) / "nodir"], actions)
+            self.assertEqual(
+                [a["status"] for a in actions], ["deleted", "not_found", "deleted", "not_found"]
+            )
+            self.assertFalse(disk.exists())
+            self.assertFalse(work_dir.exists())
+
+
+class OpenStackDeploymentRecordedTests(SimpleTestCase):
+    def _os_meta(self, **overrides):
+        os_meta = {
+            "server_id": "srv-1",
+            "image_ids": ["img-0", "img-1"],
+            "volume_ids": ["vol-0", "vol-1"],
+            "extra_volume_ids": ["vol-x"],
+            "requested_extra_disks_gb": [10],
+            "attached_volumes": [{}, {}, {}],
+        }
+        os_meta.update(overrides)
+        return os_meta
+
+    def test_complete_markers(self):
+        self.assertTrue(_openstack_deployment_recorded(self._os_meta(), 2))
+
+    def test_partial_markers_redeploy(self):
+        self.assertFalse(_openstack_deployment_recorded(self._os_meta(attached_volumes=[{}]), 2))
+        self.assertFalse(_openstack_deployment_recorded(self._os_meta(server_id=None), 2))
+        self.assertFalse(_openstack_deployment_recorded(self._os_meta(), 3))
+
+
+class ResolveFlavorAndNetworkTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _conn(self):
+        conn = MagicMock()
+        conn.compute.flavors.return_value = [SimpleNamespace(id="f-1", name="m1.small", vcpus=2, ram=2048, disk=20)]
+        conn.network.networks.return_value = [SimpleNamespace(id="n-1", name="private", is_router_external=False)]
+        return conn
+
+    def test_second_lookup_hits_cache(self):
+        spec = {"cpu": 2, "ram": 2048, "network_name": None}
+        conn = self._conn()
+        flavor, network = _resolve_flavor_and_network(conn, "session-1", spec)
+        self.assertEqual((flavor.id, network.id, network.name), ("f-1", "n-1", "private"))
+
+        other = self._conn()
+        flavor2, network2 = _resolve_flavor_and_network(other, "session-1", spec)
+        self.assertEqual((flavor2.id, network2.id), ("f-1", "n-1"))
+        other.compute.flavors.assert_not_called()
+        other.network.networks.assert_not_called()
+
+    @override_settings(OPENSTACK_LISTING_CACHE_SECONDS=60)
+    def test_picks_expire_after_thirty_seconds(self):
+        spec = {"cpu": 2, "ram": 2048, "network_name": None}
+        with patch("migrations.tasks.cache") as cache_mock:
+            cache_mock.get_many.return_value = {}
+            _resolve_flavor_and_network(self._conn(), "session-1", spec)
+        self.assertEqual(cache_mock.set_many.call_args.kwargs["timeout"], 30)
+
+    def test_scope_and_spec_partition_cache(self):
+        spec = {"cpu": 2, "ram": 2048, "network_name": None}
+        _resolve_flavor_and_network(self._conn(), "session-1", spec)
+        conn = self._conn()
+        _resolve_flavor_and_network(conn, "session-2", spec)
+        conn.compute.flavors.assert_called_once()
+        conn.network.networks.assert_called_once()
+
+
+class SaveMetadataSectionTests(TestCase):
+    def test_only_named_section_is_written(self):
+        job = MigrationJob.objects.create(
+            vm_name="vm-1",
+            status=MigrationJob.Status.DEPLOYED,
+            conversion_metadata={"conversion": {"state": "succeeded"}, "openstack": {"server_id": "srv-1"}},
+        )
+        # Another writer changed a different key after this instance was loaded.
+        MigrationJob.objects.filter(pk=job.pk).update(
+            conversion_metadata={"conversion": {"state": "succeeded"}, "openstack": {"server_id": "srv-1"}, "note": "x"}
+        )
+
+        job.conversion_metadata["openstack"]["server_status"] = "ACTIVE"
+        job.transition(MigrationJob.Status.VERIFIED, save=False)
+        job.save_metadata_section("openstack", update_fields=("status",))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, MigrationJob.Status.VERIFIED)
+        self.assertEqual(job.conversion_metadata["openstack"], {"server_id": "srv-1", "server_status": "ACTIVE"})
+        self.assertEqual(job.conversion_metadata["note"], "x")
+
+
+class AttachmentsKnownTests(SimpleTestCase):
+    def test_boot_and_already_attached_are_known(self):
+        self.assertTrue(_attachments_known([{"status": "boot_volume"}]))
+        self.assertTrue(_attachments_known([{"status": "boot_volume"}, {"status": "already_attached"}]))
+
+    def test_fresh_attach_needs_validation(self):
+        self.assertFalse(_attachments_known([{"status": "boot_volume"}, {"status": "attached"}]))
+
+
+class UpsertDiscoveredVmsTests(TestCase):
+    def test_bulk_upsert_refreshes_existing_rows(self):
+        session = VmwareEndpointSession.objects.create(host="esxi", username="root", password="x")
+        first = timezone.now()
+        items = [{"name": "vm-a", "cpu": 1, "ram": 1024}, {"name": "vm-b", "cpu": 2, "ram": 2048}]
+        self.assertEqual(_upsert_discovered_vms(DiscoveredVM.Source.ESXI, items, session, first), 2)
+
+        later = first + timedelta(minutes=5)
+        updated = [{"name": "vm-a", "cpu": 4, "ram": 4096, "power_state": "poweredOff"}]
+        _upsert_discovered_vms(DiscoveredVM.Source.ESXI, updated, session, later)
+
+        self.assertEqual(DiscoveredVM.objects.count(), 2)
+        vm_a = DiscoveredVM.objects.get(name="vm-a")
+        self.assertEqual((vm_a.cpu, vm_a.ram, vm_a.power_state, vm_a.last_seen), (4, 4096, "poweredOff", later))
+
+    def test_rows_without_session_are_not_duplicated(self):
+        now = timezone.now()
+        items = [{"name": "ws-vm", "cpu": 1, "ram": 512}]
+        _upsert_discovered_vms(DiscoveredVM.Source.WORKSTATION, items, None, now)
+        _upsert_discovered_vms(DiscoveredVM.Source.WORKSTATION, items, None, now)
+        self.assertEqual(DiscoveredVM.objects.filter(name="ws-vm").count(), 1)
+
+
+class ScheduleRollbackTests(TestCase):
+    def test_waits_for_commit(self):
+        job = SimpleNamespace(id=7, vm_name="vm-1")
+        with patch("migrations.tasks.rollback_migration") as rollback:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                _schedule_rollback(job, "boom")
+                rollback.delay.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+        rollback.delay.assert_called_once_with(7, context={"rollback_reason": "boom"})